@@ -1,64 +1,23 @@
 import csv
+import io
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from typing import Iterator, List, Dict, Tuple, Optional
 import requests
 from loguru import logger
 from tqdm import tqdm
 from stream_unzip import stream_unzip
-import time
 from ..data_sources.data_source_config import DataSourceConfig
 from ..data_processors.utils.metadata_logger import metadata_tracker
+from ..data_processors.utils.data_processor_utils import (
+    ChunkStream,
+    insert_into_motherduck,
+    skip_invalid_row,
+)
 
-
-def insert_into_motherduck(df: pd.DataFrame, conn, schema: str, table: str) -> bool:
-    """
-    Insert DataFrame into MotherDuck with retry logic.
-
-    Args:
-        df: DataFrame to insert
-        conn: Database connection
-        schema: Database schema name
-        table: Table name
-
-    Returns:
-        True if successful, False otherwise
-    """
-    max_retries = 3
-    base_delay = 3
-
-    if not conn:
-        logger.error("No connection provided")
-        return False
-
-    for attempt in range(max_retries):
-        try:
-            conn.register("temp_df", df)
-            insert_sql = f"""INSERT INTO "{schema}"."{table}" SELECT * FROM temp_df"""
-            conn.execute(insert_sql)
-
-            if attempt > 0:
-                logger.success(f"Successfully inserted data on attempt {attempt + 1}")
-
-            return True
-
-        except Exception as e:
-            conn.unregister("temp_df")
-
-            if attempt < max_retries - 1:
-                wait_time = (2**attempt) * base_delay
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                logger.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"All {max_retries} attempts failed. Final error: {e}")
-                raise
-        finally:
-            try:
-                conn.unregister("temp_df")
-            except Exception:
-                pass
-
-    return False
+# Bytes handed to the Arrow CSV reader per block
+CSV_BLOCK_SIZE = 1048576
 
 
 def validate_column_names(
@@ -143,81 +102,82 @@ def stream_csv_from_zip(
                 if str(file_name_str).lower().endswith(".csv"):
                     logger.info(f"Processing CSV: {file_name_str}")
 
-                    # Stream CSV processing
-                    row_buffer = []
-                    header = None
-                    partial_line = ""
-
-                    for chunk in unzipped_chunks:
-                        text_chunk = chunk.decode("utf-8", errors="ignore")
-                        text_chunk = partial_line + text_chunk
-                        lines = text_chunk.split("\n")
-                        partial_line = lines[-1]
-                        lines = lines[:-1]
-
-                        for line in lines:
-                            if not line.strip():
-                                continue
-
-                            if header is None:
-                                header = next(csv.reader([line]))
-
-                                # Validate columns if expected_columns provided
-                                if expected_columns:
-                                    is_valid, issues = validate_column_names(
-                                        header, expected_columns
-                                    )
-
-                                    if not is_valid:
-                                        logger.error(
-                                            f"Column validation failed for {file_name_str}:"
-                                        )
-                                        for issue in issues:
-                                            logger.error(f"  - {issue}")
-
-                                        # Raise error to skip this file
-                                        raise ValueError(
-                                            f"Invalid columns in {file_name_str}"
-                                        )
-                                    else:
-                                        logger.info(
-                                            f"✓ Column validation passed for {file_name_str}"
-                                        )
-
-                            else:
-                                try:
-                                    values = next(csv.reader([line]))
-                                    if len(values) == len(header):
-                                        row_dict = dict(zip(header, values))
-                                        row_buffer.append(row_dict)
-
-                                        # Yield batch when full
-                                        if len(row_buffer) >= batch_size:
-                                            df_batch = pd.DataFrame(row_buffer)
-                                            yield df_batch
-                                            row_buffer = []
-                                            logger.debug(
-                                                f"Yielded batch of {batch_size} rows"
-                                            )
-                                except csv.Error as e:
-                                    logger.warning(f"Error parsing CSV line: {e}")
-                                    continue
-
-                    # Process final partial line
-                    if partial_line.strip() and header:
-                        try:
-                            values = next(csv.reader([partial_line]))
-                            if len(values) == len(header):
-                                row_dict = dict(zip(header, values))
-                                row_buffer.append(row_dict)
-                        except csv.Error:
-                            pass
+                    csv_file = io.BufferedReader(
+                        ChunkStream(unzipped_chunks, errors="ignore"),
+                        buffer_size=CSV_BLOCK_SIZE,
+                    )
+
+                    # Read the header ourselves so every column can be typed as a string
+                    header_line = csv_file.readline()
+                    while header_line and not header_line.strip():
+                        header_line = csv_file.readline()
+                    if not header_line:
+                        logger.warning(f"No header found in {file_name_str}")
+                        continue
+
+                    header = next(
+                        csv.reader(
+                            [
+                                header_line.decode("utf-8-sig", errors="ignore").rstrip(
+                                    "\r\n"
+                                )
+                            ]
+                        )
+                    )
+
+                    # Validate columns if expected_columns provided
+                    if expected_columns:
+                        is_valid, issues = validate_column_names(
+                            header, expected_columns
+                        )
+
+                        if not is_valid:
+                            logger.error(
+                                f"Column validation failed for {file_name_str}:"
+                            )
+                            for issue in issues:
+                                logger.error(f"  - {issue}")
+
+                            # Raise error to skip this file
+                            raise ValueError(f"Invalid columns in {file_name_str}")
+                        else:
+                            logger.info(
+                                f"✓ Column validation passed for {file_name_str}"
+                            )
+
+                    # Rows are tokenised in C a block at a time rather than per line
+                    reader = pacsv.open_csv(
+                        csv_file,
+                        read_options=pacsv.ReadOptions(
+                            column_names=header, block_size=CSV_BLOCK_SIZE
+                        ),
+                        parse_options=pacsv.ParseOptions(
+                            invalid_row_handler=skip_invalid_row
+                        ),
+                        convert_options=pacsv.ConvertOptions(
+                            column_types={column: pa.string() for column in header},
+                            strings_can_be_null=False,
+                        ),
+                    )
+
+                    batch_buffer = []
+                    buffered_rows = 0
+
+                    for record_batch in reader:
+                        batch_buffer.append(record_batch)
+                        buffered_rows += record_batch.num_rows
+
+                        # Yield batch when full
+                        if buffered_rows >= batch_size:
+                            yield pa.Table.from_batches(batch_buffer).to_pandas()
+                            logger.debug(f"Yielded batch of {buffered_rows} rows")
+                            batch_buffer = []
+                            buffered_rows = 0
 
                     # Yield remaining rows
-                    if row_buffer:
-                        df_batch = pd.DataFrame(row_buffer)
-                        yield df_batch
-                        logger.debug(f"Yielded final batch of {len(row_buffer)} rows")
+                    if buffered_rows:
+                        yield pa.Table.from_batches(batch_buffer).to_pandas()
+                        logger.debug(f"Yielded final batch of {buffered_rows} rows")
 
     except Exception as e:
         logger.error(f"Error streaming ZIP file {zip_url}: {e}")
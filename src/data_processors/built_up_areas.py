@@ -1,14 +1,31 @@
 import requests
 import os
+import shutil
 import tempfile
-import zipfile
+import numpy as np
 import pandas as pd
-import fiona
-from shapely import wkt
-from shapely.geometry import shape
+import pyarrow as pa
+import pyogrio.raw
+import shapely
 from loguru import logger
-from tqdm import tqdm
 import time
+from typing import List
+
+from ..data_processors.utils.data_processor_utils import extract_geopackage
+
+# Bytes copied per read when saving the download to disk
+DOWNLOAD_CHUNK_SIZE = 1048576
+
+# Attribute columns of the built up areas table, before geometry
+BUILT_UP_AREA_COLUMNS = [
+    "gsscode",
+    "name1_text",
+    "name1_language",
+    "name2_text",
+    "name2_language",
+    "areahectares",
+    "geometry_area_m",
+]
 
 
 def insert_into_motherduck(df, conn, schema: str, table: str):
@@ -28,15 +45,14 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
         logger.error("No connection provided")
         return None
 
+    # Convert once so retries reuse the same Arrow table
+    arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+
     for attempt in range(max_retries):
         try:
             logger.info(f"Attempting to insert into schema: {schema}, table: {table}")
 
-            conn.register("df_temp", df)
-
-            insert_sql = f'INSERT INTO "{schema}"."{table}" SELECT * FROM df_temp'
-
-            conn.execute(insert_sql)
+            conn.from_arrow(arrow_table).insert_into(f'"{schema}"."{table}"')
 
             if attempt > 0:
                 logger.success(f"Successfully inserted data on attempt {attempt + 1}")
@@ -45,11 +61,6 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
             return None
 
         except Exception as e:
-            try:
-                conn.unregister("df_temp")
-            except Exception:
-                pass
-
             if attempt < max_retries - 1:
                 wait_time = (2**attempt) * base_delay
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
@@ -65,11 +76,14 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
 def fetch_redirect_url(url: str) -> str:
     """
     Call the redirect url and then fetch the actual download url.
+
+    Only the final response headers are read; the body is left for the
+    download itself.
     """
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        redirect_url = response.url
+        with requests.get(url, stream=True, allow_redirects=True) as response:
+            response.raise_for_status()
+            redirect_url = response.url
         logger.success(f"The Redirect URL is: {redirect_url}")
     except (requests.exceptions.RequestException, ValueError, Exception) as e:
         logger.error(f"An error retrieving the redirect URL: {e}")
@@ -77,6 +91,57 @@ def fetch_redirect_url(url: str) -> str:
     return redirect_url
 
 
+def wkb_to_valid_wkt(geometries: np.ndarray) -> np.ndarray:
+    """
+    Convert a chunk of WKB geometries to WKT, repairing invalid ones.
+
+    Invalid or empty geometries are repaired with a zero-width buffer, and
+    anything still invalid afterwards is dropped, all with shapely's
+    vectorised functions.
+
+    Args:
+        geometries: WKB bytes, None where a feature has no geometry
+
+    Returns:
+        Array of WKT strings, None where there is no valid geometry
+    """
+    parsed = shapely.from_wkb(geometries, on_invalid="ignore")
+
+    needs_repair = ~shapely.is_missing(parsed) & (
+        shapely.is_empty(parsed) | ~shapely.is_valid(parsed)
+    )
+    parsed[needs_repair] = shapely.buffer(parsed[needs_repair], 0)
+    parsed[~shapely.is_valid(parsed)] = None
+
+    return shapely.to_wkt(parsed, rounding_precision=-1, trim=False)
+
+
+def build_built_up_areas_frame(
+    field_names: List[str], field_data: List[np.ndarray], row_count: int
+) -> pd.DataFrame:
+    """
+    Build the attribute columns of the built up areas table as text.
+
+    Args:
+        field_names: Layer field names
+        field_data: One array of values per field
+        row_count: Number of features in the layer
+
+    Returns:
+        DataFrame in table column order, values as strings or None
+    """
+    fields = dict(zip(field_names, field_data))
+    columns = {}
+
+    for col in BUILT_UP_AREA_COLUMNS:
+        values = pd.Series(
+            fields[col] if col in fields else [None] * row_count, dtype=object
+        )
+        columns[col] = values.astype(str).where(values.notna(), None)
+
+    return pd.DataFrame(columns)
+
+
 def load_geopackage_built_up_areas(
     url: str, conn, batch_size: int, schema: str, table: str
 ):
@@ -103,165 +168,45 @@ def load_geopackage_built_up_areas(
         # Create a temporary directory
         with tempfile.TemporaryDirectory() as temp_dir:
             # Write the zip file to the temporary directory
+            # Stream straight to disk so the archive is never held in memory
             zip_path = os.path.join(temp_dir, "built_up_areas.zip")
+            response.raw.decode_content = True
             with open(zip_path, "wb") as zip_file:
-                zip_file.write(response.content)
-
-            logger.info("Extracting Built Up Areas zip file...")
-            # Extract the contents of the zip file
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            # Find the GeoPackage file for Built Up Areas
-            gpkg_file = None
-            for root, dirs, files in os.walk(temp_dir):
-                for file_name in files:
-                    if (
-                        file_name.endswith(".gpkg")
-                        and "built_up_areas" in file_name.lower()
-                    ):
-                        gpkg_file = os.path.join(root, file_name)
-                        logger.success(f"Found Built Up Areas GeoPackage: {gpkg_file}")
-                        break
-                if gpkg_file:
-                    break
-
-            if not gpkg_file:
-                # Fallback: look for any gpkg file
-                for root, dirs, files in os.walk(temp_dir):
-                    for file_name in files:
-                        if file_name.endswith(".gpkg"):
-                            gpkg_file = os.path.join(root, file_name)
-                            logger.info(f"Found GeoPackage file: {gpkg_file}")
-                            break
-                    if gpkg_file:
-                        break
+                shutil.copyfileobj(response.raw, zip_file, DOWNLOAD_CHUNK_SIZE)
+
+            logger.info("Extracting Built Up Areas GeoPackage...")
+            gpkg_file = extract_geopackage(zip_path, temp_dir, "built_up_areas")
+            if gpkg_file:
+                logger.success(f"Found Built Up Areas GeoPackage: {gpkg_file}")
 
             if gpkg_file:
                 try:
-                    # Open the GeoPackage file
-                    with fiona.open(gpkg_file, "r") as src:
-                        # Print metadata
-                        crs = src.crs
-                        data_schema = src.schema
-
-                        logger.info(f"CRS: {crs}")
-                        logger.info(f"Schema: {data_schema}")
-
-                        # Get total number of features
-                        total_features = len(src)
-                        logger.info(f"Total Built Up Areas features: {total_features}")
-
-                        features = []
-
-                        for i, feature in enumerate(
-                            tqdm(
-                                src,
-                                total=total_features,
-                                desc="Processing Built Up Areas",
-                            )
-                        ):
-                            try:
-                                geom_wkt = None
-                                if feature.get("geometry"):
-                                    try:
-                                        geom = shape(feature["geometry"])
-
-                                        if geom and geom.is_valid:
-                                            geom_wkt = wkt.dumps(geom)
-                                        else:
-                                            try:
-                                                geom = geom.buffer(0)
-                                                geom_wkt = (
-                                                    wkt.dumps(geom)
-                                                    if geom.is_valid
-                                                    else None
-                                                )
-                                            except Exception:
-                                                geom_wkt = None
-                                    except Exception:
-                                        geom_wkt = None
-
-                                # Create record - convert everything to string
-                                built_up_area_record = {
-                                    "gsscode": str(
-                                        feature["properties"].get("gsscode", "")
-                                    )
-                                    if feature["properties"].get("gsscode") is not None
-                                    else None,
-                                    "name1_text": str(
-                                        feature["properties"].get("name1_text", "")
-                                    )
-                                    if feature["properties"].get("name1_text")
-                                    is not None
-                                    else None,
-                                    "name1_language": str(
-                                        feature["properties"].get("name1_language", "")
-                                    )
-                                    if feature["properties"].get("name1_language")
-                                    is not None
-                                    else None,
-                                    "name2_text": str(
-                                        feature["properties"].get("name2_text", "")
-                                    )
-                                    if feature["properties"].get("name2_text")
-                                    is not None
-                                    else None,
-                                    "name2_language": str(
-                                        feature["properties"].get("name2_language", "")
-                                    )
-                                    if feature["properties"].get("name2_language")
-                                    is not None
-                                    else None,
-                                    "areahectares": str(
-                                        feature["properties"].get("areahectares", "")
-                                    )
-                                    if feature["properties"].get("areahectares")
-                                    is not None
-                                    else None,
-                                    "geometry_area_m": str(
-                                        feature["properties"].get("geometry_area_m", "")
-                                    )
-                                    if feature["properties"].get("geometry_area_m")
-                                    is not None
-                                    else None,
-                                    "geometry": geom_wkt,
-                                }
-
-                            except Exception as e:
-                                # Fallback with nulls grrrr
-                                built_up_area_record = {
-                                    "gsscode": None,
-                                    "name1_text": None,
-                                    "name1_language": None,
-                                    "name2_text": None,
-                                    "name2_language": None,
-                                    "areahectares": None,
-                                    "geometry_area_m": None,
-                                    "geometry": None,
-                                }
-                                error_msg = f"Error processing feature {i}: {e}"
-                                logger.warning(error_msg)
-                                errors.append(error_msg)
-
-                            features.append(built_up_area_record)
-
-                            # Process batch when it reaches chunk_size
-                            if len(features) == chunk_size:
-                                df_chunk = pd.DataFrame(features)
-                                insert_into_motherduck(df_chunk, conn, schema, table)
-                                logger.info(
-                                    f"Processed Built Up Areas batch: {i - chunk_size + 1} to {i}"
-                                )
-                                features = []
-
-                        # Process any remaining features
-                        if features:
-                            df_chunk = pd.DataFrame(features)
-                            insert_into_motherduck(df_chunk, conn, schema, table)
-                            logger.info(
-                                f"Processed remaining Built Up Areas features: {len(features)}"
-                            )
+                    # Geometries come back as WKB, so no GeoJSON dicts are built
+                    meta, _, geometries, field_data = pyogrio.raw.read(
+                        gpkg_file, columns=BUILT_UP_AREA_COLUMNS
+                    )
+
+                    logger.info(f"CRS: {meta['crs']}")
+                    logger.info(f"Schema: {dict(zip(meta['fields'], meta['dtypes']))}")
+
+                    total_features = len(geometries)
+                    logger.info(f"Total Built Up Areas features: {total_features}")
+
+                    df_all = build_built_up_areas_frame(
+                        meta["fields"], field_data, total_features
+                    )
+
+                    for start in range(0, total_features, chunk_size):
+                        end = min(start + chunk_size, total_features)
+                        df_chunk = df_all.iloc[start:end].assign(
+                            geometry=wkb_to_valid_wkt(geometries[start:end])
+                        )
+
+                        insert_into_motherduck(df_chunk, conn, schema, table)
+                        logger.info(
+                            f"Processed Built Up Areas batch: {start} to {end - 1}"
+                        )
+                        del df_chunk
 
                 except Exception as e:
                     error_msg = f"Error processing Built Up Areas GeoPackage: {e}"
@@ -1,64 +1,17 @@
 import csv
+import io
 import os
-import time
-import json
 import requests
+import numpy as np
 import pandas as pd
+import shapely
 from typing import Iterator, Optional, Dict, List, Tuple
 from loguru import logger
 from tqdm import tqdm
-from shapely.geometry import shape, Point
-
-
-def insert_into_motherduck(df: pd.DataFrame, conn, schema: str, table: str) -> bool:
-    """
-    Insert DataFrame into MotherDuck with retry logic.
-
-    Args:
-        df: DataFrame to insert
-        conn: Database connection
-        schema: Database schema name
-        table: Table name
-
-    Returns:
-        True if successful, False otherwise
-    """
-    max_retries = 3
-    base_delay = 3
-
-    if not conn:
-        logger.error("No connection provided")
-        return False
-
-    for attempt in range(max_retries):
-        try:
-            conn.register("temp_df", df)
-            insert_sql = f"""INSERT INTO "{schema}"."{table}" SELECT * FROM temp_df"""
-            conn.execute(insert_sql)
-
-            if attempt > 0:
-                logger.success(f"Successfully inserted data on attempt {attempt + 1}")
-
-            return True
-
-        except Exception as e:
-            conn.unregister("temp_df")
-
-            if attempt < max_retries - 1:
-                wait_time = (2**attempt) * base_delay
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                logger.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"All {max_retries} attempts failed. Final error: {e}")
-                raise
-        finally:
-            try:
-                conn.unregister("temp_df")
-            except Exception:
-                pass
-
-    return False
+from ..data_processors.utils.data_processor_utils import (
+    insert_into_motherduck,
+    prefetch_batches,
+)
 
 
 def validate_column_names(
@@ -124,87 +77,111 @@ def stream_csv_from_url(
         total_size = int(response.headers.get("content-length", 0))
         logger.info(f"File size: {total_size:,} bytes")
 
-        row_buffer = []
-        header = None
-        partial_line = ""
-
-        with tqdm(
-            total=total_size, unit="B", unit_scale=True, desc="Streaming"
-        ) as pbar:
-            for chunk in response.iter_content(chunk_size=1048576):
-                pbar.update(len(chunk))
-
-                text_chunk = chunk.decode("utf-8", errors="ignore")
-                text_chunk = partial_line + text_chunk
-                lines = text_chunk.split("\n")
-                partial_line = lines[-1]
-                lines = lines[:-1]
-
-                for line in lines:
-                    if not line.strip():
-                        continue
-
-                    if header is None:
-                        header = next(csv.reader([line]))
-
-                        if header and header[0].startswith("\ufeff"):
-                            header[0] = header[0].replace("\ufeff", "")
-                            logger.info("Stripped BOM from first column")
-
-                        logger.info(f"CSV Headers: {header}")
-                        logger.debug(f"Header repr: {[repr(h) for h in header]}")
-
-                        if expected_columns:
-                            logger.info(
-                                f"Expected columns: {list(expected_columns.keys())}"
-                            )
-                            is_valid, issues = validate_column_names(
-                                header, expected_columns
-                            )
-
-                            if not is_valid:
-                                logger.error("Column validation failed:")
-                                for issue in issues:
-                                    logger.error(f"  - {issue}")
-                                logger.warning("Proceeding despite column mismatch")
-                            else:
-                                logger.info("✓ Column validation passed")
-
-                    else:
-                        try:
-                            values = next(csv.reader([line]))
-                            if len(values) == len(header):
-                                row_dict = dict(zip(header, values))
-                                row_buffer.append(row_dict)
-
-                                if len(row_buffer) >= batch_size:
-                                    df_batch = pd.DataFrame(row_buffer)
-                                    yield df_batch
-                                    row_buffer = []
-                                    logger.debug(f"Yielded batch of {batch_size} rows")
-                        except csv.Error as e:
-                            logger.warning(f"Error parsing CSV line: {e}")
-                            continue
-
-            if partial_line.strip() and header:
+        # One reader over the decoded body keeps tokenising in C and handles
+        # lines that span network chunks
+        response.raw.decode_content = True
+        text_stream = io.TextIOWrapper(
+            response.raw, encoding="utf-8", errors="ignore", newline=""
+        )
+        reader = csv.reader(text_stream)
+
+        header = next((row for row in reader if row), None)
+        if header is None:
+            logger.warning(f"No header found in {csv_url}")
+            return
+
+        if header[0].startswith("\ufeff"):
+            header[0] = header[0].replace("\ufeff", "")
+            logger.info("Stripped BOM from first column")
+
+        logger.info(f"CSV Headers: {header}")
+        logger.debug(f"Header repr: {[repr(h) for h in header]}")
+
+        if expected_columns:
+            logger.info(f"Expected columns: {list(expected_columns.keys())}")
+            is_valid, issues = validate_column_names(header, expected_columns)
+
+            if not is_valid:
+                logger.error("Column validation failed:")
+                for issue in issues:
+                    logger.error(f"  - {issue}")
+                logger.warning("Proceeding despite column mismatch")
+            else:
+                logger.info("✓ Column validation passed")
+
+        # Fixed-size buffer reused across batches, filled via a write cursor
+        row_buffer = [None] * batch_size
+        cursor = 0
+
+        with tqdm(unit="rows", unit_scale=True, desc="Streaming") as pbar:
+            while True:
                 try:
-                    values = next(csv.reader([partial_line]))
-                    if len(values) == len(header):
-                        row_dict = dict(zip(header, values))
-                        row_buffer.append(row_dict)
-                except csv.Error:
-                    pass
-
-            if row_buffer:
-                df_batch = pd.DataFrame(row_buffer)
-                yield df_batch
-                logger.debug(f"Yielded final batch of {len(row_buffer)} rows")
+                    values = next(reader)
+                except StopIteration:
+                    break
+                except csv.Error as e:
+                    logger.warning(f"Error parsing CSV line: {e}")
+                    continue
+
+                if len(values) != len(header):
+                    continue
+
+                row_buffer[cursor] = values
+                cursor += 1
+
+                if cursor == batch_size:
+                    pbar.update(cursor)
+                    yield pd.DataFrame(row_buffer, columns=header)
+                    cursor = 0
+                    logger.debug(f"Yielded batch of {batch_size} rows")
+
+            if cursor:
+                pbar.update(cursor)
+                yield pd.DataFrame(row_buffer[:cursor], columns=header)
+                logger.debug(f"Yielded final batch of {cursor} rows")
 
     except Exception as e:
         logger.error(f"Error streaming CSV file {csv_url}: {e}")
         raise
 
 
+def geo_points_to_wkt(points: pd.Series) -> np.ndarray:
+    """
+    Convert "lat, lon" strings to WKT points with shapely's vectorised functions.
+
+    Args:
+        points: Geo Point column from the CSV
+
+    Returns:
+        Array of WKT strings, None where the value could not be parsed
+    """
+    parts = points.str.split(",")
+    lat = pd.to_numeric(parts.str[0].str.strip(), errors="coerce")
+    lon = pd.to_numeric(parts.str[1].str.strip(), errors="coerce")
+    valid = (parts.str.len() == 2) & lat.notna() & lon.notna()
+
+    geometries = np.full(len(points), None, dtype=object)
+    geometries[valid.to_numpy()] = shapely.points(
+        lon[valid].to_numpy(dtype=float), lat[valid].to_numpy(dtype=float)
+    )
+    return shapely.to_wkt(geometries, rounding_precision=-1)
+
+
+def geo_shapes_to_wkt(shapes: pd.Series) -> np.ndarray:
+    """
+    Convert GeoJSON geometry strings to WKT with shapely's vectorised functions.
+
+    Args:
+        shapes: Geo Shape column from the CSV
+
+    Returns:
+        Array of WKT strings, None where the value could not be parsed
+    """
+    values = shapes.where(shapes.notna() & (shapes != ""), None).to_numpy(dtype=object)
+    geometries = shapely.from_geojson(values, on_invalid="ignore")
+    return shapely.to_wkt(geometries, rounding_precision=-1)
+
+
 def process_streaming_csv(
     url: str,
     batch_size: int,
@@ -234,46 +211,21 @@ def process_streaming_csv(
     try:
         logger.info(f"Starting streaming process for {url}")
 
-        for df_batch in stream_csv_from_url(url, batch_size, expected_columns):
+        # Download and parse the next batch while the current one is inserted
+        for df_batch in prefetch_batches(
+            stream_csv_from_url(url, batch_size, expected_columns)
+        ):
             batch_count += 1
             batch_rows = len(df_batch)
 
             try:
+                # Whole-column shapely calls release the GIL, so the prefetch
+                # thread keeps parsing while geometries are converted
                 if "Geo Point" in df_batch.columns:
-
-                    def point_to_wkt(point_str):
-                        if pd.isna(point_str) or not point_str:
-                            return None
-                        try:
-                            parts = point_str.split(",")
-                            if len(parts) == 2:
-                                lat = float(parts[0].strip())
-                                lon = float(parts[1].strip())
-                                return Point(lon, lat).wkt
-                        except Exception:
-                            pass
-                        return None
-
-                    df_batch["geo_point_wkt"] = df_batch["Geo Point"].apply(
-                        point_to_wkt
-                    )
+                    df_batch["geo_point_wkt"] = geo_points_to_wkt(df_batch["Geo Point"])
 
                 if "Geo Shape" in df_batch.columns:
-
-                    def geojson_to_wkt(geojson_str):
-                        if pd.isna(geojson_str) or not geojson_str:
-                            return None
-                        try:
-                            geojson_obj = json.loads(geojson_str)
-                            geom = shape(geojson_obj)
-                            return geom.wkt
-                        except Exception:
-                            pass
-                        return None
-
-                    df_batch["geo_shape_wkt"] = df_batch["Geo Shape"].apply(
-                        geojson_to_wkt
-                    )
+                    df_batch["geo_shape_wkt"] = geo_shapes_to_wkt(df_batch["Geo Shape"])
 
                 # Log sample geometry data after first conversion - just to check it works
                 if batch_count == 1 and len(df_batch) > 0:
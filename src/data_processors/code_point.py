@@ -1,19 +1,45 @@
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import os
+import shutil
 import tempfile
-import zipfile
+import numpy as np
 import pandas as pd
-import fiona
-from shapely import wkt
-from shapely.geometry import shape
+import pyarrow as pa
+import pyogrio
+import shapely
 from loguru import logger
-from tqdm import tqdm
 import time
 from typing import Optional
 
 from ..data_processors.utils.metadata_logger import metadata_tracker
+from ..data_processors.utils.data_processor_utils import extract_geopackage
 from ..data_sources.data_source_config import DataSourceConfig
 
+# Bytes copied per read when saving the download to disk
+DOWNLOAD_CHUNK_SIZE = 1048576
+
+# Threads reading GeoPackage slices ahead of the inserts
+READ_WORKERS = 4
+
+# Column order of the code_point table
+CODE_POINT_COLUMNS = [
+    "postcode",
+    "positional_quality_indicator",
+    "country_code",
+    "nhs_regional_ha_code",
+    "nhs_ha_code",
+    "admin_county_code",
+    "admin_district_code",
+    "admin_ward_code",
+    "geometry",
+]
+STRING_COLUMNS = tuple(
+    col for col in CODE_POINT_COLUMNS if col != "positional_quality_indicator"
+)
+
 
 def insert_into_motherduck(df, conn, schema: str, table: str):
     """
@@ -32,20 +58,17 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
         logger.error("No connection provided")
         return None
 
+    # Convert once so retries reuse the same Arrow table
+    arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+
     for attempt in range(max_retries):
         try:
             logger.info(f"Attempting to insert into schema: {schema}, table: {table}")
 
-            conn.register("df_temp", df)
-
-            if schema == "post_code_data" and table == "code_point":
-                insert_sql = (
-                    """INSERT INTO post_code_data.code_point SELECT * FROM df_temp"""
-                )
-            else:
+            if not (schema == "post_code_data" and table == "code_point"):
                 raise ValueError(f"Invalid schema or table: {schema}.{table}")
 
-            conn.execute(insert_sql)
+            conn.from_arrow(arrow_table).insert_into('"post_code_data"."code_point"')
 
             if attempt > 0:
                 logger.success(f"Successfully inserted data on attempt {attempt + 1}")
@@ -54,11 +77,6 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
             return None
 
         except Exception as e:
-            try:
-                conn.unregister("df_temp")
-            except Exception:
-                pass
-
             if attempt < max_retries - 1:
                 wait_time = (2**attempt) * base_delay
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
@@ -74,12 +92,14 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
 def fetch_redirect_url(url: str) -> str:
     """
     Call the redirect url and then fetch the actual download url.
-    This is suboptimal and will change in future versions.
+
+    Only the final response headers are read; the body is left for the
+    download itself.
     """
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        redirect_url = response.url
+        with requests.get(url, stream=True, allow_redirects=True) as response:
+            response.raise_for_status()
+            redirect_url = response.url
         logger.success(f"The Redirect URL is: {redirect_url}")
     except (requests.exceptions.RequestException, ValueError, Exception) as e:
         logger.error(f"An error retrieving the redirect URL: {e}")
@@ -87,6 +107,86 @@ def fetch_redirect_url(url: str) -> str:
     return redirect_url
 
 
+def geometry_to_wkt(geometries: np.ndarray, offset: int, errors: list) -> np.ndarray:
+    """
+    Convert a chunk of geometries to WKT with shapely's vectorised functions.
+
+    Args:
+        geometries: Shapely geometries, None where a feature has no geometry
+        offset: Index of the first feature in the chunk, used in warnings
+        errors: List that conversion errors are appended to
+
+    Returns:
+        Array of WKT strings, None where the feature has no geometry
+    """
+    for i in np.flatnonzero(shapely.is_missing(geometries)):
+        error_msg = f"Error converting geometry for feature {offset + i}"
+        logger.warning(error_msg)
+        errors.append(error_msg)
+
+    return shapely.to_wkt(geometries, rounding_precision=-1, trim=False)
+
+
+def build_code_point_frame(
+    properties: pd.DataFrame, geometries: np.ndarray
+) -> pd.DataFrame:
+    """
+    Build a chunk DataFrame in code_point column order from feature properties.
+
+    Args:
+        properties: Attribute columns of the chunk
+        geometries: WKT geometry for each feature
+
+    Returns:
+        DataFrame ready to insert into the code_point table
+    """
+    df_chunk = properties.assign(geometry=geometries)
+
+    for col in CODE_POINT_COLUMNS:
+        if col not in df_chunk.columns:
+            df_chunk[col] = None
+
+    df_chunk = df_chunk[CODE_POINT_COLUMNS]
+
+    for col in STRING_COLUMNS:
+        df_chunk[col] = df_chunk[col].astype(str)
+
+    df_chunk["positional_quality_indicator"] = pd.to_numeric(
+        df_chunk["positional_quality_indicator"], errors="coerce"
+    )
+
+    return df_chunk
+
+
+def read_code_point_chunk(
+    gpkg_file: str, start: int, count: int, errors: list
+) -> pd.DataFrame:
+    """
+    Read one slice of the GeoPackage and build its code_point chunk.
+
+    GDAL releases the GIL while reading, so slices can be read on several
+    threads at once.
+
+    Args:
+        gpkg_file: Path to the GeoPackage
+        start: Index of the first feature in the slice
+        count: Maximum number of features to read
+        errors: List that conversion errors are appended to
+
+    Returns:
+        DataFrame ready to insert into the code_point table
+    """
+    # Fields outside the code_point table are never read
+    gdf = pyogrio.read_dataframe(
+        gpkg_file, columns=CODE_POINT_COLUMNS, skip_features=start, max_features=count
+    )
+
+    return build_code_point_frame(
+        pd.DataFrame(gdf.drop(columns=gdf.geometry.name)),
+        geometry_to_wkt(gdf.geometry.values, start, errors),
+    )
+
+
 def load_geopackage_open_code_point(
     url: str, conn, batch_size: int, schema: str, table: str, tracker=None
 ):
@@ -107,163 +207,74 @@ def load_geopackage_open_code_point(
         response = requests.get(url, stream=True)
         response.raise_for_status()
 
-        file_size = len(response.content)
-        if tracker:
-            tracker.set_file_size(file_size)
-
         with tempfile.TemporaryDirectory() as temp_dir:
             zip_path = os.path.join(temp_dir, "temp.zip")
+
+            # Stream straight to disk so the archive is never held in memory
+            response.raw.decode_content = True
             with open(zip_path, "wb") as zip_file:
-                zip_file.write(response.content)
-
-            logger.info("Extracting zip file...")
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            # Find the GeoPackage file
-            gpkg_file = None
-            for root, dirs, files in os.walk(temp_dir):
-                logger.info(f"Root: {dirs}")
-                for file_name in files:
-                    if file_name.endswith(".gpkg"):
-                        gpkg_file = os.path.join(root, file_name)
-                    logger.success(f"The GeoPackage file is: {gpkg_file}")
-                    break
+                shutil.copyfileobj(response.raw, zip_file, DOWNLOAD_CHUNK_SIZE)
 
+            file_size = os.path.getsize(zip_path)
+            if tracker:
+                tracker.set_file_size(file_size)
+
+            logger.info("Extracting GeoPackage...")
+            gpkg_file = extract_geopackage(zip_path, temp_dir)
             if gpkg_file:
-                try:
-                    with fiona.open(gpkg_file, "r") as src:
-                        crs = src.crs
-                        data_schema = src.schema
-
-                        logger.info(f"The CRS is: {crs}")
-                        logger.info(f"The Data Schema is: {data_schema}")
-
-                        total_features = len(src)
-                        if tracker:
-                            tracker.set_rows_processed(total_features)
-                            tracker.add_info("total_features", total_features)
-                            tracker.add_info("batch_size", batch_size)
-                            tracker.add_info("file_format", "geopackage")
-                            tracker.add_info("crs", str(crs))
-
-                        features = []
-
-                        for i, feature in enumerate(
-                            tqdm(src, total=total_features, desc="Processing features")
-                        ):
-                            try:
-                                geom = shape(feature["geometry"])
-                                feature["properties"]["geometry"] = wkt.dumps(geom)
-                            except Exception as e:
-                                feature["properties"]["geometry"] = None
-                                error_msg = (
-                                    f"Error converting geometry for feature {i}: {e}"
-                                )
-                                logger.warning(error_msg)
-                                errors.append(error_msg)
-
-                            features.append(feature["properties"])
-
-                            if len(features) == chunk_size:
-                                df_chunk = pd.DataFrame(features)
-
-                                expected_columns = [
-                                    "postcode",
-                                    "positional_quality_indicator",
-                                    "country_code",
-                                    "nhs_regional_ha_code",
-                                    "nhs_ha_code",
-                                    "admin_county_code",
-                                    "admin_district_code",
-                                    "admin_ward_code",
-                                    "geometry",
-                                ]
-
-                                for col in expected_columns:
-                                    if col not in df_chunk.columns:
-                                        df_chunk[col] = None
-
-                                df_chunk = df_chunk[expected_columns]
-
-                                string_columns = [
-                                    "postcode",
-                                    "country_code",
-                                    "nhs_regional_ha_code",
-                                    "nhs_ha_code",
-                                    "admin_county_code",
-                                    "admin_district_code",
-                                    "admin_ward_code",
-                                    "geometry",
-                                ]
-
-                                for col in string_columns:
-                                    if col in df_chunk.columns:
-                                        df_chunk[col] = df_chunk[col].astype(str)
-
-                                if "positional_quality_indicator" in df_chunk.columns:
-                                    df_chunk["positional_quality_indicator"] = (
-                                        pd.to_numeric(
-                                            df_chunk["positional_quality_indicator"],
-                                            errors="coerce",
-                                        )
-                                    )
+                logger.success(f"The GeoPackage file is: {gpkg_file}")
 
-                                insert_into_motherduck(df_chunk, conn, schema, table)
-                                logger.info(
-                                    f"Processed features {i - chunk_size + 1} to {i}"
-                                )
-                                features = []
-
-                        if features:
-                            df_chunk = pd.DataFrame(features)
-
-                            expected_columns = [
-                                "postcode",
-                                "positional_quality_indicator",
-                                "country_code",
-                                "nhs_regional_ha_code",
-                                "nhs_ha_code",
-                                "admin_county_code",
-                                "admin_district_code",
-                                "admin_ward_code",
-                                "geometry",
-                            ]
-
-                            for col in expected_columns:
-                                if col not in df_chunk.columns:
-                                    df_chunk[col] = None
-
-                            df_chunk = df_chunk[expected_columns]
-
-                            string_columns = [
-                                "postcode",
-                                "country_code",
-                                "nhs_regional_ha_code",
-                                "nhs_ha_code",
-                                "admin_county_code",
-                                "admin_district_code",
-                                "admin_ward_code",
-                                "geometry",
-                            ]
-
-                            for col in string_columns:
-                                if col in df_chunk.columns:
-                                    df_chunk[col] = df_chunk[col].astype(str)
-
-                            if "positional_quality_indicator" in df_chunk.columns:
-                                df_chunk["positional_quality_indicator"] = (
-                                    pd.to_numeric(
-                                        df_chunk["positional_quality_indicator"],
-                                        errors="coerce",
+            if gpkg_file:
+                try:
+                    info = pyogrio.read_info(gpkg_file)
+                    crs = info["crs"]
+
+                    logger.info(f"The CRS is: {crs}")
+                    logger.info(
+                        f"The Data Schema is: {dict(zip(info['fields'], info['dtypes']))}"
+                    )
+
+                    total_features = info["features"]
+                    if tracker:
+                        tracker.set_rows_processed(total_features)
+                        tracker.add_info("total_features", total_features)
+                        tracker.add_info("batch_size", batch_size)
+                        tracker.add_info("file_format", "geopackage")
+                        tracker.add_info("crs", str(crs))
+
+                    # Slices are read and converted on worker threads while the
+                    # main thread inserts finished chunks in file order
+                    starts = iter(range(0, total_features, chunk_size))
+                    pending = deque()
+
+                    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+
+                        def fill_pending():
+                            for start in islice(starts, READ_WORKERS - len(pending)):
+                                pending.append(
+                                    (
+                                        start,
+                                        executor.submit(
+                                            read_code_point_chunk,
+                                            gpkg_file,
+                                            start,
+                                            chunk_size,
+                                            errors,
+                                        ),
                                     )
                                 )
 
+                        fill_pending()
+                        while pending:
+                            start, future = pending.popleft()
+                            df_chunk = future.result()
+                            fill_pending()
+
                             insert_into_motherduck(df_chunk, conn, schema, table)
                             logger.info(
-                                f"Processed remaining features: {len(features)}"
+                                f"Processed features {start} to {start + len(df_chunk) - 1}"
                             )
-                            features = []
+                            del df_chunk
 
                 except Exception as e:
                     error_msg = f"Error processing GeoPackage: {e}"
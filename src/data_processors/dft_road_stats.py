@@ -79,17 +79,18 @@ def clean_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean DataFrame column names and data for database insertion.
 
+    Works on df itself rather than a copy, since the frame read from the
+    ODS file has no other users.
+
     Args:
         df: DataFrame to clean
 
     Returns:
-        Cleaned DataFrame
+        The same DataFrame, cleaned
     """
-    df_clean = df.copy()
-
     # Clean column names: lowercase, replace spaces with underscores
-    df_clean.columns = (
-        df_clean.columns.str.lower()
+    df.columns = (
+        df.columns.str.lower()
         .str.replace(" ", "_", regex=False)
         .str.replace("-", "_", regex=False)
         .str.replace("(", "", regex=False)
@@ -100,10 +101,10 @@ def clean_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
     )
 
     # Convert all columns to string type
-    for col in df_clean.columns:
-        df_clean[col] = df_clean[col].astype(str).replace(["nan", "None", "NaN"], None)
+    for col in df.columns:
+        df[col] = df[col].astype(str).replace(["nan", "None", "NaN"], None)
 
-    return df_clean
+    return df
 
 
 def process_ods_file(
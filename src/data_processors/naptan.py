@@ -1,13 +1,31 @@
 import csv
 import pandas as pd
-from typing import Iterator, List, Dict, Tuple, Optional
+import pyarrow as pa
+import pyarrow.compute as pc
+from functools import lru_cache
+from typing import Callable, Iterator, List, Dict, Tuple, Optional
 import requests
 from loguru import logger
 from tqdm import tqdm
-from ..data_processors.utils.data_processor_utils import insert_table
+from ..data_processors.utils.data_processor_utils import (
+    insert_into_motherduck,
+    insert_table,
+)
 from ..data_sources.data_source_config import DataProcessorType, DataSourceConfig
 from ..data_processors.utils.metadata_logger import metadata_tracker
 
+# Per-batch progress is only logged every N batches to keep loguru off the hot path
+LOG_EVERY_N_BATCHES = 100
+
+ARROW_TYPES = {
+    "BIGINT": pa.int64(),
+    "DOUBLE": pa.float64(),
+    "TIMESTAMP": pa.timestamp("us"),
+}
+
+# Text values that stand for NULL in string columns
+STRING_NULLS = pa.array(["nan", "NaN", "None"], type=pa.string())
+
 
 def validate_column_names(
     header: List[str], expected_columns: Dict[str, str]
@@ -38,12 +56,108 @@ def validate_column_names(
     return len(issues) == 0, issues
 
 
+def to_numeric(series: pd.Series, dtype: str) -> pd.Series:
+    """
+    Convert a string column to numbers using Arrow's vectorised cast.
+
+    Arrow rejects the whole column if any value fails to parse, in which case
+    this falls back to pd.to_numeric so unparseable values become NULL.
+
+    Args:
+        series: Column of strings with nulls already normalised
+        dtype: Target database type, either "BIGINT" or "DOUBLE"
+
+    Returns:
+        Numeric column with the same index as the input
+    """
+    try:
+        arr = pa.array(series, type=pa.string(), from_pandas=True)
+        converted = pc.cast(arr, ARROW_TYPES[dtype], safe=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.to_numeric(series, errors="coerce")
+
+    return pd.Series(
+        converted.to_numpy(zero_copy_only=False), index=series.index, name=series.name
+    )
+
+
+def mask_string_nulls(series: pd.Series) -> pd.Series:
+    """
+    Null out sentinel text in a string column using Arrow compute kernels.
+
+    The column is held as an Arrow string array, so the values stay in one
+    UTF-8 buffer instead of being boxed into Python objects by astype(str).
+
+    Args:
+        series: Column of CSV text values
+
+    Returns:
+        Arrow-backed string column with sentinels replaced by NULL
+    """
+    try:
+        arr = pa.array(series, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return series.astype(str).replace(STRING_NULLS.to_pylist(), None)
+
+    masked = pc.if_else(
+        pc.is_in(arr, value_set=STRING_NULLS), pa.scalar(None, pa.string()), arr
+    )
+    return pd.Series(
+        pd.arrays.ArrowExtensionArray(masked), index=series.index, name=series.name
+    )
+
+
+@lru_cache(maxsize=8)
+def _compile_cleaner(
+    expected_items: Tuple[Tuple[str, str], ...],
+) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """
+    Generate a cleaning function specialised to a fixed column schema.
+
+    The schema does not change for the lifetime of a stream, so the dtype
+    dispatch is resolved once here rather than on every batch.
+
+    Args:
+        expected_items: Tuple of (column name, type) pairs
+
+    Returns:
+        Function that cleans a DataFrame in place and returns it
+    """
+    lines = ["def _clean(df):", "    cols = set(df.columns)"]
+
+    for col, dtype in expected_items:
+        name = repr(col)
+        lines.append(f"    if {name} in cols:")
+        if dtype in ["DOUBLE", "BIGINT"]:
+            lines.append(
+                f"        df[{name}] = to_numeric("
+                f"df[{name}].replace(_NUMERIC_NULLS, pd.NA), {dtype!r})"
+            )
+        elif dtype == "TIMESTAMP":
+            lines.append(f"        df[{name}] = None")
+        else:
+            lines.append(f"        df[{name}] = mask_string_nulls(df[{name}])")
+    lines.append("    return df")
+
+    namespace = {
+        "pd": pd,
+        "to_numeric": to_numeric,
+        "mask_string_nulls": mask_string_nulls,
+        "_NUMERIC_NULLS": ["", "nan", "NaN", "None", " "],
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["_clean"]
+
+
 def clean_naptan_data(
     df: pd.DataFrame, expected_columns: Dict[str, str]
 ) -> pd.DataFrame:
     """
     Clean NAPTAN data - set problematic values to NULL.
 
+    Columns are replaced in place on the frame passed in. Every batch is
+    freshly built by stream_csv_from_url, so no defensive copy is taken.
+
     Args:
         df: DataFrame to clean
         expected_columns: Dict of column names and their expected types
@@ -51,26 +165,25 @@ def clean_naptan_data(
     Returns:
         Cleaned DataFrame
     """
-    df_cleaned = df.copy()
+    df_cleaned = _compile_cleaner(tuple(expected_columns.items()))(df)
+    logger.opt(lazy=True).debug(
+        "Cleaned DataFrame shape: {shape}", shape=lambda: df_cleaned.shape
+    )
+    return df_cleaned
 
-    for col, dtype in expected_columns.items():
-        if col in df_cleaned.columns:
-            if dtype in ["DOUBLE", "BIGINT"]:
-                df_cleaned[col] = df_cleaned[col].replace(
-                    ["", "nan", "NaN", "None", " "], pd.NA
-                )
-                df_cleaned[col] = pd.to_numeric(df_cleaned[col], errors="coerce")
 
-            elif dtype == "TIMESTAMP":
-                logger.debug(f"Setting timestamp column {col} to NULL")
-                df_cleaned[col] = None
+def build_batch(header: List[str], column_buffers: List[List[str]]) -> pd.DataFrame:
+    """
+    Build a DataFrame from per-column value lists.
 
-            else:
-                df_cleaned[col] = (
-                    df_cleaned[col].astype(str).replace(["nan", "NaN", "None"], None)
-                )
-    logger.debug(f"Cleaned DataFrame shape: {df_cleaned.shape}")
-    return df_cleaned
+    Args:
+        header: Column names from the CSV
+        column_buffers: One list of values per header column
+
+    Returns:
+        DataFrame with one column per header name
+    """
+    return pd.DataFrame(dict(zip(header, column_buffers)), copy=False)
 
 
 def stream_csv_from_url(
@@ -98,30 +211,53 @@ def stream_csv_from_url(
         with tqdm(
             total=total_size, unit="B", unit_scale=True, desc="Streaming CSV"
         ) as pbar:
-            row_buffer = []
+            # Values are buffered column by column rather than as a dict per row
+            column_buffers = []
+            buffered_rows = 0
             header = None
-            partial_line = ""
+            partial_line = bytearray()
 
             for chunk in response.iter_content(chunk_size=1048576):
                 if chunk:
                     pbar.update(len(chunk))
 
-                    try:
-                        text_chunk = chunk.decode("utf-8")
-                    except UnicodeDecodeError:
-                        text_chunk = chunk.decode("utf-8", errors="ignore")
+                    # Accumulate raw bytes in place until a complete block of lines
+                    # is available so each chunk is decoded once and multi-byte
+                    # characters are never split across chunk boundaries
+                    partial_line.extend(chunk)
+                    last_newline = partial_line.rfind(b"\n")
+                    if last_newline == -1:
+                        continue
 
-                    text_chunk = partial_line + text_chunk
-                    lines = text_chunk.split("\n")
-                    partial_line = lines[-1]
-                    lines = lines[:-1]
+                    complete = bytes(partial_line[:last_newline])
+                    del partial_line[: last_newline + 1]
 
-                    for line in lines:
-                        if not line.strip():
+                    try:
+                        text_chunk = complete.decode("utf-8")
+                    except UnicodeDecodeError:
+                        text_chunk = complete.decode("utf-8", errors="ignore")
+
+                    lines = (line for line in text_chunk.split("\n") if line.strip())
+
+                    # Blocks without quotes can't hold embedded delimiters, so a
+                    # plain split gives the same fields as csv.reader
+                    if '"' in text_chunk:
+                        reader = csv.reader(lines)
+                    else:
+                        reader = (line.rstrip("\r").split(",") for line in lines)
+
+                    while True:
+                        try:
+                            values = next(reader)
+                        except StopIteration:
+                            break
+                        except csv.Error as e:
+                            logger.warning(f"Error parsing CSV line: {e}")
                             continue
 
                         if header is None:
-                            header = next(csv.reader([line]))
+                            header = values
+                            column_buffers = [[] for _ in header]
 
                             if expected_columns:
                                 is_valid, issues = validate_column_names(
@@ -136,56 +272,68 @@ def stream_csv_from_url(
                                     raise ValueError("Invalid columns in CSV")
                                 else:
                                     logger.info("✓ Column validation passed")
-                        else:
-                            try:
-                                values = next(csv.reader([line]))
-                                if len(values) == len(header):
-                                    row_dict = dict(zip(header, values))
-                                    row_buffer.append(row_dict)
-
-                                    # Yield batch when full
-                                    if len(row_buffer) >= batch_size:
-                                        df_batch = pd.DataFrame(row_buffer)
-
-                                        # Clean the data if expected_columns provided
-                                        if expected_columns:
-                                            df_batch = clean_naptan_data(
-                                                df_batch, expected_columns
-                                            )
-
-                                        yield df_batch
-                                        row_buffer = []
-                                        logger.debug(
-                                            f"Yielded batch of {batch_size} rows"
-                                        )
-
-                            except csv.Error as e:
-                                logger.warning(f"Error parsing CSV line: {e}")
-                                continue
+                        elif len(values) == len(header):
+                            for column, value in zip(column_buffers, values):
+                                column.append(value)
+                            buffered_rows += 1
+
+                            # Yield batch when full
+                            if buffered_rows == batch_size:
+                                df_batch = build_batch(header, column_buffers)
+
+                                # Clean the data if expected_columns provided
+                                if expected_columns:
+                                    df_batch = clean_naptan_data(
+                                        df_batch, expected_columns
+                                    )
+
+                                column_buffers = [[] for _ in header]
+                                buffered_rows = 0
+                                yield df_batch
 
             if partial_line.strip() and header:
                 try:
-                    values = next(csv.reader([partial_line]))
+                    values = next(
+                        csv.reader([partial_line.decode("utf-8", errors="ignore")])
+                    )
                     if len(values) == len(header):
-                        row_dict = dict(zip(header, values))
-                        row_buffer.append(row_dict)
+                        for column, value in zip(column_buffers, values):
+                            column.append(value)
+                        buffered_rows += 1
                 except csv.Error:
                     pass
 
-            if row_buffer:
-                df_batch = pd.DataFrame(row_buffer)
+            if buffered_rows:
+                df_batch = build_batch(header, column_buffers)
 
                 if expected_columns:
                     df_batch = clean_naptan_data(df_batch, expected_columns)
 
                 yield df_batch
-                logger.debug(f"Yielded final batch of {len(row_buffer)} rows")
 
     except Exception as e:
         logger.error(f"Error streaming CSV file {csv_url}: {e}")
         raise
 
 
+def arrow_schema_from_columns(expected_columns: Dict[str, str]) -> pa.Schema:
+    """
+    Build an Arrow schema matching the table template.
+
+    Args:
+        expected_columns: Dict of column names and their database types
+
+    Returns:
+        PyArrow schema with columns in template order
+    """
+    return pa.schema(
+        [
+            (col, ARROW_TYPES.get(dtype, pa.string()))
+            for col, dtype in expected_columns.items()
+        ]
+    )
+
+
 def process_streaming_data(
     url: str,
     batch_size: int,
@@ -198,6 +346,12 @@ def process_streaming_data(
     """
     Process CSV data from URL using true streaming.
 
+    Each batch is inserted on its own, with the shared retry logic; a batch
+    that still fails (including one whose values do not fit the template's
+    types) is logged and skipped so the rest of the file still loads. For
+    MotherDuck with a table template, batches are converted to Arrow with
+    the template schema before the insert.
+
     Args:
         url: URL of the CSV file
         batch_size: Batch size for processing
@@ -214,18 +368,33 @@ def process_streaming_data(
     try:
         logger.info(f"Starting streaming process for {url}")
 
+        arrow_schema = (
+            arrow_schema_from_columns(expected_columns)
+            if processor_type == DataProcessorType.MOTHERDUCK and expected_columns
+            else None
+        )
+
         # Process streamed batches
         for df_batch in stream_csv_from_url(url, batch_size, expected_columns):
             batch_count += 1
             batch_rows = len(df_batch)
 
             try:
-                insert_table(df_batch, conn, schema_name, table_name, processor_type)
+                if arrow_schema is not None:
+                    table_batch = pa.Table.from_pandas(
+                        df_batch, schema=arrow_schema, preserve_index=False
+                    )
+                    insert_into_motherduck(table_batch, conn, schema_name, table_name)
+                else:
+                    insert_table(
+                        df_batch, conn, schema_name, table_name, processor_type
+                    )
 
                 total_rows += batch_rows
-                logger.info(
-                    f"Processed batch {batch_count} ({batch_rows} rows, {total_rows} total)"
-                )
+                if batch_count == 1 or batch_count % LOG_EVERY_N_BATCHES == 0:
+                    logger.info(
+                        f"Processed batch {batch_count} ({batch_rows} rows, {total_rows} total)"
+                    )
 
             except Exception as e:
                 error_msg = f"Error processing batch {batch_count}: {e}"
@@ -3,55 +3,127 @@ import time
 import requests
 import os
 import tempfile
-import zipfile
-import csv
+import posixpath
+from functools import lru_cache
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 from tqdm import tqdm
-from typing import Optional, Dict
+from stream_unzip import stream_unzip
+from typing import Optional, Dict, Tuple
 from ..data_sources.data_source_config import DataProcessorType, DataSourceConfig
 from ..data_processors.utils.metadata_logger import metadata_tracker
 from ..data_processors.utils.data_processor_utils import insert_table
 
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Values treated as NULL - empty strings only count for numeric columns
+NULL_SENTINELS = ("", "nan", "NaN", "null")
+STRING_SENTINELS = NULL_SENTINELS[1:]
+NULL_SENTINEL_ARRAY = pa.array(NULL_SENTINELS)
+NUMERIC_TYPES = frozenset({"BIGINT", "DOUBLE", "INTEGER"})
+
+
+@lru_cache(maxsize=8)
+def split_numeric_columns(
+    expected_items: Tuple[Tuple[str, str], ...],
+) -> Dict[str, str]:
+    """
+    Pick out the numeric columns of a schema, cached per schema.
+
+    Args:
+        expected_items: tuple(expected_columns.items())
+
+    Returns:
+        Dict of numeric column names and their database types
+    """
+    return {col: dtype for col, dtype in expected_items if dtype in NUMERIC_TYPES}
+
+
+def parse_bigint_column(series: pd.Series) -> Optional[pd.Series]:
+    """
+    Parse a column of integer strings with Arrow's compiled cast.
+
+    Sentinel values become NULL before the cast. Arrow rejects the whole
+    column if anything else fails to parse, in which case None is returned
+    so the caller can fall back to pd.to_numeric.
+
+    Args:
+        series: Column of strings from the CSV batch
+
+    Returns:
+        Nullable Int64 column, or None if the column could not be cast
+    """
+    try:
+        arr = pa.array(series, type=pa.string(), from_pandas=True)
+        is_sentinel = pc.is_in(arr, value_set=NULL_SENTINEL_ARRAY)
+        arr = pc.if_else(is_sentinel, pa.scalar(None, pa.string()), arr)
+        parsed = pc.cast(arr, pa.int64())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+    return pd.Series(
+        parsed.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get),
+        index=series.index,
+        name=series.name,
+    )
+
 
 def clean_dataframe_for_motherduck(
     df: pd.DataFrame, expected_columns: Dict[str, str]
 ) -> pd.DataFrame:
-    """Clean DataFrame and handle empty strings for numeric columns."""
-    df_clean = df.copy()
+    """
+    Clean DataFrame and handle empty strings for numeric columns.
 
-    numeric_columns = {
-        col: dtype
-        for col, dtype in expected_columns.items()
-        if dtype in ["BIGINT", "DOUBLE", "INTEGER"]
-    }
+    The DataFrame is modified in place; callers pass a freshly built batch.
+    """
+    numeric_columns = split_numeric_columns(tuple(expected_columns.items()))
+    df_columns = frozenset(df.columns)
+    fallback_numeric = []
 
     for col, dtype in numeric_columns.items():
-        if col in df_clean.columns:
-            df_clean[col] = df_clean[col].replace(["", "nan", "NaN", "null"], None)
-
+        if col in df_columns:
             if dtype == "BIGINT":
-                # Convert to numeric first, then to nullable integer
-                numeric_series = pd.to_numeric(df_clean[col], errors="coerce")
-                df_clean[col] = pd.Series(numeric_series).astype("Int64")
-            elif dtype == "DOUBLE":
-                df_clean[col] = pd.to_numeric(df_clean[col], errors="coerce")
+                parsed = parse_bigint_column(df[col])
+                if parsed is not None:
+                    df[col] = parsed
+                    continue
+            fallback_numeric.append(col)
+
+    # Null every sentinel across the remaining numeric block in one isin/mask pass
+    if fallback_numeric:
+        numeric_block = df[fallback_numeric]
+        numeric_block = numeric_block.mask(numeric_block.isin(NULL_SENTINELS))
 
-    string_columns = [col for col in df_clean.columns if col not in numeric_columns]
-    for col in string_columns:
-        df_clean[col] = df_clean[col].astype(str).replace(["nan", "NaN", "null"], None)
+        for col in fallback_numeric:
+            numeric_series = pd.to_numeric(numeric_block[col], errors="coerce")
+            if numeric_columns[col] == "BIGINT":
+                # Nullable integer is only needed for BIGINT targets
+                numeric_series = numeric_series.astype("Int64")
+            df[col] = numeric_series
 
-    return df_clean
+    # csv.DictReader already yields strings, so mask the whole string block at once
+    string_columns = [col for col in df.columns if col not in numeric_columns]
+    if string_columns:
+        values = df[string_columns].to_numpy()
+        df[string_columns] = np.where(np.isin(values, STRING_SENTINELS), None, values)
+
+    return df
 
 
 def fetch_redirect_url(url: str) -> str:
     """
     Call the redirect url and then fetch the actual download url.
-    This is suboptimal and will change in future versions.
+
+    Only the final response headers are read; the body is left for the
+    download itself.
     """
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        redirect_url = response.url
+        with requests.get(url, stream=True, allow_redirects=True) as response:
+            response.raise_for_status()
+            redirect_url = response.url
     except (requests.exceptions.RequestException, ValueError, Exception):
         logger.error("An error retrieving the redirect URL")
         raise
@@ -79,10 +151,7 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
     def attempt_insert(retry_count):
         """Closure for handling a single insert attempt with logging"""
         try:
-            conn.register("temp_df", df)
-
-            insert_sql = f"""INSERT INTO "{schema}"."{table}" SELECT * FROM temp_df"""
-            conn.execute(insert_sql)
+            conn.from_df(df).insert_into(f'"{schema}"."{table}"')
 
             if retry_count > 0:
                 logger.success(
@@ -107,6 +176,78 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
     return False
 
 
+def build_csv_select(expected_columns: Dict[str, str]) -> str:
+    """
+    Build the SELECT list that types raw CSV columns to match the table.
+
+    Mirrors clean_dataframe_for_motherduck: null sentinels become NULL and
+    numeric values that fail to parse are coerced to NULL.
+
+    Args:
+        expected_columns: Dict of column names and their database types
+
+    Returns:
+        Comma separated SQL expressions in template order
+    """
+    expressions = []
+    for col, dtype in expected_columns.items():
+        quoted = '"' + col.replace('"', '""') + '"'
+        if dtype in ["BIGINT", "DOUBLE", "INTEGER"]:
+            expressions.append(
+                f"TRY_CAST(CASE WHEN {quoted} IN ('nan', 'NaN', 'null') THEN NULL "
+                f"ELSE {quoted} END AS {dtype}) AS {quoted}"
+            )
+        else:
+            expressions.append(
+                f"CASE WHEN {quoted} IN ('nan', 'NaN', 'null') THEN NULL "
+                f"ELSE COALESCE({quoted}, '') END AS {quoted}"
+            )
+    return ", ".join(expressions)
+
+
+def insert_csv_file_into_motherduck(
+    csv_file: str, conn, schema: str, table: str, expected_columns: Dict[str, str]
+) -> Tuple[int, int]:
+    """
+    Load a CSV file straight into MotherDuck with DuckDB's native CSV reader.
+
+    Columns are read positionally as VARCHAR, matching the DictReader path, and
+    typed inside the INSERT so no rows pass through Python. Rows that are
+    short are padded with NULLs, while rows with too many values (or bad
+    encoding) are skipped and counted so one bad line doesn't sink the file.
+
+    Args:
+        csv_file: Path to the extracted CSV file
+        conn: DuckDB connection object
+        schema: Database schema
+        table: Table name
+        expected_columns: Dict of column names and their database types
+
+    Returns:
+        Tuple of (rows inserted, rows skipped)
+    """
+    columns = ", ".join(
+        "'" + col.replace("'", "''") + "': 'VARCHAR'" for col in expected_columns
+    )
+    # Ragged rows trip the sniffer, so spell the dialect out instead
+    insert_sql = f"""INSERT INTO "{schema}"."{table}"
+        SELECT {build_csv_select(expected_columns)}
+        FROM read_csv(
+            ?, header = true, auto_detect = false, columns = {{{columns}}},
+            null_padding = true, ignore_errors = true, store_rejects = true
+        )"""
+
+    result = conn.execute(insert_sql, [csv_file]).fetchone()
+    inserted = result[0] if result else 0
+
+    skipped = conn.execute(
+        """SELECT count(DISTINCT line) FROM reject_errors
+        WHERE scan_id = (SELECT max(scan_id) FROM reject_scans)"""
+    ).fetchone()[0]
+
+    return inserted, skipped
+
+
 def load_csv_data(
     url: str,
     conn,
@@ -155,11 +296,11 @@ def load_csv_data(
         """Closure for processing a batch of data"""
         nonlocal total_rows_processed
 
-        if not batch:
+        if batch.num_rows == 0:
             return
 
         try:
-            df_chunk = pd.DataFrame(batch)
+            df_chunk = batch.to_pandas()
 
             # Clean the dataframe if expected_columns are available
             if expected_columns:
@@ -167,7 +308,7 @@ def load_csv_data(
 
             insert_table(df_chunk, conn, schema, name, processor_type)
 
-            batch_size = len(batch)
+            batch_size = batch.num_rows
             total_rows_processed += batch_size
             start_row = total_rows_processed - batch_size + 1
 
@@ -185,60 +326,90 @@ def load_csv_data(
         response.raise_for_status()
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            zip_path = os.path.join(temp_dir, "temp.zip")
             total_size = int(response.headers.get("content-length", 0))
             file_size = total_size
             logger.info(f"Downloading {total_size / 1024 / 1024:.2f} MB")
 
-            with open(zip_path, "wb") as zip_file:
-                with tqdm(
-                    total=total_size, unit="B", unit_scale=True, desc="Downloading"
-                ) as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        zip_file.write(chunk)
-                        pbar.update(len(chunk))
-
-            logger.info("Extracting zip file")
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
+            def download_chunks(pbar):
+                # Read large blocks straight from the raw stream to keep the
+                # number of Python-level iterations per GB low
+                response.raw.decode_content = True
+                for chunk in iter(lambda: response.raw.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    pbar.update(len(chunk))
+                    yield chunk
 
+            # Unzip while downloading and only write the NSPL CSV to disk
             csv_file = None
-            for root, dirs, files in os.walk(temp_dir):
-                if "Data" in dirs:
-                    data_dir = os.path.join(root, "Data")
-                    for filename in os.listdir(data_dir):
-                        if filename.endswith(".csv") and "NSPL" in filename:
-                            csv_file = os.path.join(data_dir, filename)
-                            print(csv_file)
+            with tqdm(
+                total=total_size, unit="B", unit_scale=True, desc="Downloading"
+            ) as pbar:
+                for file_name, _, unzipped_chunks in stream_unzip(
+                    download_chunks(pbar)
+                ):
+                    member = file_name.decode("utf-8", errors="ignore")
+                    filename = posixpath.basename(member)
+                    in_data_dir = (
+                        posixpath.basename(posixpath.dirname(member)) == "Data"
+                    )
+
+                    if in_data_dir and filename.endswith(".csv") and "NSPL" in filename:
+                        csv_file = os.path.join(temp_dir, filename)
+                        logger.info(f"Extracting {member}")
+                        with open(csv_file, "wb") as out_file:
+                            for unzipped_chunk in unzipped_chunks:
+                                out_file.write(unzipped_chunk)
+                    else:
+                        for _ in unzipped_chunks:
+                            pass
 
             if not csv_file:
                 handle_error("No CSV file found in the zip archive")
                 raise FileNotFoundError("No CSV file found in the zip archive")
 
-            total_lines = sum(1 for _ in open(csv_file))
-            logger.info(f"Processing {total_lines - 1} rows from CSV")
+            if processor_type == DataProcessorType.MOTHERDUCK:
+                logger.info(f"Loading {csv_file} with DuckDB read_csv")
+                total_rows_processed, skipped = insert_csv_file_into_motherduck(
+                    csv_file, conn, schema, name, expected_columns
+                )
+                if skipped:
+                    handle_error(f"Skipped {skipped} malformed rows in the NSPL CSV")
+                return total_rows_processed, file_size, len(fieldnames)
+
+            csv_size = os.path.getsize(csv_file)
+            logger.info(f"Processing {csv_size / 1024 / 1024:.2f} MB from CSV")
+
+            def skip_invalid_row(row):
+                handle_error("Skipping malformed row", row.text)
+                return "skip"
+
+            # Columns are read positionally as strings, matching the table template
+            reader = pacsv.open_csv(
+                csv_file,
+                read_options=pacsv.ReadOptions(
+                    column_names=fieldnames, skip_rows=1, block_size=1048576
+                ),
+                parse_options=pacsv.ParseOptions(invalid_row_handler=skip_invalid_row),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={col: pa.string() for col in fieldnames},
+                    strings_can_be_null=False,
+                ),
+            )
 
             current_batch = []
-            with open(csv_file, "r", newline="") as file:
-                reader = csv.DictReader(file, fieldnames=fieldnames)
-                next(reader)
-
-                for i, row in enumerate(
-                    tqdm(reader, total=total_lines - 1, desc="Processing rows"), 1
-                ):
-                    try:
-                        current_batch.append(row)
-
-                        if len(current_batch) >= batch_limit:
-                            process_batch(current_batch)
-                            current_batch = []
-
-                    except Exception as e:
-                        handle_error("Error processing row", e, i)
-                        continue
-
-                if current_batch:
-                    process_batch(current_batch, is_final=True)
+            buffered_rows = 0
+            with tqdm(unit="rows", desc="Processing rows") as pbar:
+                for record_batch in reader:
+                    pbar.update(record_batch.num_rows)
+                    current_batch.append(record_batch)
+                    buffered_rows += record_batch.num_rows
+
+                    if buffered_rows >= batch_limit:
+                        process_batch(pa.Table.from_batches(current_batch))
+                        current_batch = []
+                        buffered_rows = 0
+
+            if current_batch:
+                process_batch(pa.Table.from_batches(current_batch), is_final=True)
 
     except Exception as e:
         handle_error("Error processing the zip file", e)
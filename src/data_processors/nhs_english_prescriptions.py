@@ -1,72 +1,26 @@
 import csv
-import time
+import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, Iterator, List, Optional, Tuple
 
 import pyarrow as pa
-import requests
+import pyarrow.csv as pacsv
 from loguru import logger
 from tqdm import tqdm
 
+from ..data_processors.utils.data_processor_utils import (
+    ChunkStream,
+    insert_into_motherduck,
+    load_httpfs,
+    skip_invalid_row,
+)
 from ..data_processors.utils.metadata_logger import metadata_tracker
 from ..data_sources.data_source_config import DataSourceConfig
+from ..data_sources.http_session import HTTP_SESSION
 
-
-def insert_into_motherduck(
-    arrow_table: pa.Table, conn, schema: str, table: str
-) -> bool:
-    """
-    Insert Arrow Table into MotherDuck with retry logic.
-
-    Args:
-        arrow_table: Arrow Table to insert
-        conn: Database connection
-        schema: Database schema name
-        table: Table name
-
-    Returns:
-        True if successful, False otherwise
-    """
-    max_retries = 3
-    base_delay = 3
-
-    if not conn:
-        logger.error("No connection provided")
-        return False
-
-    for attempt in range(max_retries):
-        try:
-            conn.register("temp_arrow", arrow_table)
-            insert_sql = (
-                f"""INSERT INTO "{schema}"."{table}" SELECT * FROM temp_arrow"""
-            )
-            conn.execute(insert_sql)
-
-            if attempt > 0:
-                logger.success(f"Successfully inserted data on attempt {attempt + 1}")
-
-            return True
-
-        except Exception as e:
-            try:
-                conn.unregister("temp_arrow")
-            except Exception:
-                pass
-
-            if attempt < max_retries - 1:
-                wait_time = (2**attempt) * base_delay
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                logger.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"All {max_retries} attempts failed. Final error: {e}")
-                raise
-        finally:
-            try:
-                conn.unregister("temp_arrow")
-            except Exception:
-                pass
-
-    return False
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+MAX_WORKERS = 4
 
 
 def validate_column_names(
@@ -82,9 +36,11 @@ def validate_column_names(
     Returns Tuple[bool, List[str]]:
         (is_valid, list_of_issues)
     """
-    expected_names = set(expected_columns.keys())
     actual_names = set(header)
+    if actual_names == expected_columns.keys():
+        return True, []
 
+    expected_names = set(expected_columns.keys())
     issues = []
 
     missing = expected_names - actual_names
@@ -98,6 +54,20 @@ def validate_column_names(
     return len(issues) == 0, issues
 
 
+@lru_cache(maxsize=8)
+def build_string_schema(column_names: Tuple[str, ...]) -> pa.Schema:
+    """
+    Build an all-string Arrow schema, cached so each layout is built once.
+
+    Args:
+        column_names: Column names in output order
+
+    Returns:
+        PyArrow schema typing every column as a string
+    """
+    return pa.schema([(name, pa.string()) for name in column_names])
+
+
 def stream_csv_from_url(
     csv_url: str,
     batch_size: int,
@@ -108,6 +78,9 @@ def stream_csv_from_url(
     Stream CSV data directly from a URL with optional column validation.
     All data is converted to strings for simplicity and consistency.
 
+    The response body is parsed by PyArrow's streaming CSV reader, so rows
+    never pass through Python one at a time.
+
     Args:
         csv_url: URL of the CSV file
         batch_size: Number of rows per batch
@@ -118,111 +91,163 @@ def stream_csv_from_url(
     """
     try:
         logger.info(f"Starting CSV stream from {csv_url}")
-        response = requests.get(csv_url, stream=True, timeout=30)
-        response.raise_for_status()
+        # Closing the response hands the connection back to the shared pool,
+        # which is sized for more than MAX_WORKERS concurrent downloads
+        with HTTP_SESSION.get(csv_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+
+            total_size = int(response.headers.get("content-length", 0))
+
+            if tracker:
+                tracker.set_file_size(total_size)
+
+            # Invalid UTF-8 bytes are dropped, as Arrow would reject the file
+            csv_file = io.BufferedReader(
+                ChunkStream(
+                    response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE),
+                    errors="ignore",
+                ),
+                buffer_size=DOWNLOAD_CHUNK_SIZE,
+            )
 
-        total_size = int(response.headers.get("content-length", 0))
+            # Read the header ourselves so every column can be typed as a string
+            header = next(
+                csv.reader([csv_file.readline().decode("utf-8-sig").rstrip("\r\n")])
+            )
+            logger.info(f"Found {len(header)} columns: {header[:5]}...")
+
+            # Validate columns if expected_columns provided
+            if expected_columns:
+                is_valid, issues = validate_column_names(header, expected_columns)
+
+                if not is_valid:
+                    logger.error("Column validation failed:")
+                    for issue in issues:
+                        logger.error(f"  - {issue}")
+                    raise ValueError("Invalid columns in CSV")
+                else:
+                    logger.info("✓ Column validation passed")
+
+            # With a template the batches come out in table column order
+            string_schema = build_string_schema(
+                tuple(expected_columns) if expected_columns else tuple(header)
+            )
+            reader = pacsv.open_csv(
+                csv_file,
+                read_options=pacsv.ReadOptions(
+                    block_size=DOWNLOAD_CHUNK_SIZE, column_names=header
+                ),
+                parse_options=pacsv.ParseOptions(invalid_row_handler=skip_invalid_row),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=string_schema,
+                    include_columns=string_schema.names,
+                    null_values=[""],
+                    strings_can_be_null=True,
+                ),
+            )
+            batch_buffer = []
+            buffered_rows = 0
 
-        row_buffer = []
-        header = None
-        partial_line = ""
+            with tqdm(unit="rows", unit_scale=True, desc="Streaming CSV") as pbar:
+                for record_batch in reader:
+                    pbar.update(record_batch.num_rows)
+                    batch_buffer.append(record_batch)
+                    buffered_rows += record_batch.num_rows
 
-        if tracker:
-            tracker.set_file_size(total_size)
-
-        with tqdm(
-            total=total_size, unit="B", unit_scale=True, desc="Streaming CSV"
-        ) as pbar:
-            for chunk in response.iter_content(chunk_size=1048576):
-                if chunk:
-                    pbar.update(len(chunk))
-
-                    try:
-                        text_chunk = chunk.decode("utf-8", errors="ignore")
-                    except UnicodeDecodeError:
-                        logger.warning("Failed to decode chunk as UTF-8, skipping")
-                        continue
-
-                    text_chunk = partial_line + text_chunk
-                    lines = text_chunk.split("\n")
-                    partial_line = lines[-1]
-                    lines = lines[:-1]  # THIS HANDLES PARTIAL LINES DON'T FORGET!!
-
-                    for line in lines:
-                        if not line.strip():
-                            continue
-
-                        if header is None:
-                            # Parse header
-                            header = next(csv.reader([line]))
-                            logger.info(f"Found {len(header)} columns: {header[:5]}...")
-
-                            # Validate columns if expected_columns provided
-                            if expected_columns:
-                                is_valid, issues = validate_column_names(
-                                    header, expected_columns
-                                )
-
-                                if not is_valid:
-                                    logger.error("Column validation failed:")
-                                    for issue in issues:
-                                        logger.error(f"  - {issue}")
-                                    raise ValueError("Invalid columns in CSV")
-                                else:
-                                    logger.info("✓ Column validation passed")
-
-                        else:
-                            try:
-                                values = next(csv.reader([line]))
-                                if len(values) == len(header):
-                                    # Convert all values to strings, handle empty/None
-                                    string_values = [
-                                        str(v) if v and v.strip() else None
-                                        for v in values
-                                    ]
-                                    row_dict = dict(zip(header, string_values))
-                                    row_buffer.append(row_dict)
-
-                                    if len(row_buffer) >= batch_size:
-                                        # Create Arrow table with all string columns
-                                        arrow_table = pa.Table.from_pylist(row_buffer)
-                                        yield arrow_table
-                                        row_buffer = []
-                                        logger.debug(
-                                            f"Yielded batch of {batch_size} rows"
-                                        )
-                                else:
-                                    logger.warning(
-                                        f"Row has {len(values)} values but header has {len(header)} columns"
-                                    )
-                            except csv.Error as e:
-                                logger.warning(f"Error parsing CSV line: {e}")
-                                continue
-
-            if partial_line.strip() and header:
-                try:
-                    values = next(csv.reader([partial_line]))
-                    if len(values) == len(header):
-                        # Convert all values to strings, handle empty/None
-                        string_values = [
-                            str(v) if v and v.strip() else None for v in values
-                        ]
-                        row_dict = dict(zip(header, string_values))
-                        row_buffer.append(row_dict)
-                except csv.Error:
-                    pass
-
-            if row_buffer:
-                # Create Arrow table with all string columns
-                arrow_table = pa.Table.from_pylist(row_buffer)
-                yield arrow_table
-                logger.debug(f"Yielded final batch of {len(row_buffer)} rows")
+                    if buffered_rows >= batch_size:
+                        yield pa.Table.from_batches(batch_buffer, schema=string_schema)
+                        batch_buffer = []
+                        buffered_rows = 0
+
+            if batch_buffer:
+                yield pa.Table.from_batches(batch_buffer, schema=string_schema)
 
     except Exception as e:
         logger.error(f"Error streaming CSV file {csv_url}: {e}")
         raise
 
 
+def build_csv_select(columns: List[str], expected_columns: Dict[str, str]) -> str:
+    """
+    Build a SELECT list that types an all-VARCHAR CSV inside DuckDB.
+
+    Blank or whitespace-only cells become NULL, as the row-by-row loader
+    did, and non-text columns are cast with TRY_CAST.
+
+    Args:
+        columns: Column names in output order
+        expected_columns: Dict of expected column names and types
+
+    Returns:
+        Comma separated SELECT expressions, one per column
+    """
+    select_list = []
+    for name in columns:
+        quoted = '"' + name.replace('"', '""') + '"'
+        dtype = expected_columns.get(name, "VARCHAR")
+
+        if dtype.upper() in ("VARCHAR", "TEXT", "STRING"):
+            expression = f"CASE WHEN trim({quoted}) = '' THEN NULL ELSE {quoted} END"
+        else:
+            expression = f"TRY_CAST(NULLIF(trim({quoted}), '') AS {dtype})"
+
+        select_list.append(f"{expression} AS {quoted}")
+
+    return ", ".join(select_list)
+
+
+def insert_csv_url_into_motherduck(
+    url: str,
+    conn,
+    schema_name: str,
+    table_name: str,
+    expected_columns: Optional[Dict[str, str]] = None,
+) -> int:
+    """
+    Load a CSV URL into MotherDuck with DuckDB's native CSV reader.
+
+    Columns are read as VARCHAR, the same as the streaming path, then
+    trimmed and cast to the template types in template order.
+
+    Args:
+        url: URL of the CSV file
+        conn: Database connection
+        schema_name: Schema name
+        table_name: Table name
+        expected_columns: Dict of expected column names and types for validation
+
+    Returns:
+        Number of rows inserted
+    """
+    source_sql = "read_csv(?, header = true, all_varchar = true)"
+
+    header = [
+        column[0]
+        for column in conn.execute(
+            f"SELECT * FROM {source_sql} LIMIT 0", [url]
+        ).description
+    ]
+
+    if expected_columns:
+        is_valid, issues = validate_column_names(header, expected_columns)
+        if not is_valid:
+            logger.error("Column validation failed:")
+            for issue in issues:
+                logger.error(f"  - {issue}")
+            raise ValueError("Invalid columns in CSV")
+        logger.info("✓ Column validation passed")
+
+    select_list = build_csv_select(
+        list(expected_columns) if expected_columns else header,
+        expected_columns or {},
+    )
+    result = conn.execute(
+        f"""INSERT INTO "{schema_name}"."{table_name}" SELECT {select_list} FROM {source_sql}""",
+        [url],
+    ).fetchone()
+    return result[0] if result else 0
+
+
 def process_streaming_csv(
     url: str,
     batch_size: int,
@@ -263,7 +288,19 @@ def process_streaming_csv(
     try:
         logger.info(f"Starting streaming process for {url}")
 
-        # Process streamed batches
+        if load_httpfs(conn):
+            total_rows = insert_csv_url_into_motherduck(
+                url, conn, schema_name, table_name, expected_columns
+            )
+            logger.success(f"Completed processing {table_name} with {total_rows} rows")
+
+            if tracker:
+                tracker.add_info("total_batches", 1)
+                tracker.add_info("errors_count", 0)
+
+            return total_rows, file_size
+
+        # Fall back to streaming batches through Python
         for arrow_batch in stream_csv_from_url(
             url, batch_size, expected_columns, tracker
         ):
@@ -314,9 +351,9 @@ def process_streaming_csv(
                 logger.error(f"... and {len(errors) - 5} more errors")
 
 
-def process_nhs_prescriptions(
-    download_links: List[str],
-    table_names: List[str],
+def process_prescription_file(
+    csv_url: str,
+    table_name: str,
     batch_size: int,
     conn,
     schema_name: str,
@@ -324,11 +361,11 @@ def process_nhs_prescriptions(
     config: Optional[DataSourceConfig] = None,
 ) -> None:
     """
-    Process NHS English Prescriptions CSV files with metadata tracking.
+    Process a single NHS English Prescriptions CSV file.
 
     Args:
-        download_links: List of CSV URLs
-        table_names: List of table names
+        csv_url: URL of the CSV file
+        table_name: Table to load the file into
         batch_size: Batch size for processing
         conn: Database connection
         schema_name: Schema name
@@ -337,45 +374,15 @@ def process_nhs_prescriptions(
         config: Data source configuration (enables metadata logging and
             date-aware schema selection if provided)
     """
-    if len(download_links) != len(table_names):
-        raise ValueError(
-            "Number of download links must match the number of table names"
-        )
+    logger.info(f"Processing {table_name} from {csv_url}")
 
-    for csv_url, table_name in zip(download_links, table_names):
-        logger.info(f"Processing {table_name} from {csv_url}")
-
-        table_expected_columns = expected_columns
-        if config and hasattr(config, "get_table_template"):
-            table_expected_columns = config.get_table_template(table_name)
-            logger.info(f"Using date-specific schema for {table_name}")
-
-        if config:
-            with metadata_tracker(config, conn, csv_url) as tracker:
-                try:
-                    total_rows, file_size = process_streaming_csv(
-                        url=csv_url,
-                        batch_size=batch_size,
-                        conn=conn,
-                        schema_name=schema_name,
-                        table_name=table_name,
-                        expected_columns=table_expected_columns,
-                        tracker=tracker,
-                    )
-
-                    tracker.set_rows_processed(total_rows)
-                    tracker.set_file_size(file_size)
-                    tracker.add_info("batch_size", batch_size)
-                    tracker.add_info("table_name", table_name)
-                    tracker.add_info("file_format", "csv")
-
-                    logger.success(f"Completed processing table: {table_name}")
-
-                except Exception as e:
-                    logger.error(f"Failed to process {table_name}: {e}")
-                    raise
-        else:
-            logger.warning("No config provided - metadata logging disabled")
+    table_expected_columns = expected_columns
+    if config and hasattr(config, "get_table_template"):
+        table_expected_columns = config.get_table_template(table_name)
+        logger.info(f"Using date-specific schema for {table_name}")
+
+    if config:
+        with metadata_tracker(config, conn, csv_url) as tracker:
             try:
                 total_rows, file_size = process_streaming_csv(
                     url=csv_url,
@@ -384,10 +391,100 @@ def process_nhs_prescriptions(
                     schema_name=schema_name,
                     table_name=table_name,
                     expected_columns=table_expected_columns,
+                    tracker=tracker,
                 )
 
+                tracker.set_rows_processed(total_rows)
+                tracker.set_file_size(file_size)
+                tracker.add_info("batch_size", batch_size)
+                tracker.add_info("table_name", table_name)
+                tracker.add_info("file_format", "csv")
+
                 logger.success(f"Completed processing table: {table_name}")
 
             except Exception as e:
                 logger.error(f"Failed to process {table_name}: {e}")
-                continue
+                raise
+    else:
+        logger.warning("No config provided - metadata logging disabled")
+        try:
+            total_rows, file_size = process_streaming_csv(
+                url=csv_url,
+                batch_size=batch_size,
+                conn=conn,
+                schema_name=schema_name,
+                table_name=table_name,
+                expected_columns=table_expected_columns,
+            )
+
+            logger.success(f"Completed processing table: {table_name}")
+
+        except Exception as e:
+            logger.error(f"Failed to process {table_name}: {e}")
+
+
+def process_nhs_prescriptions(
+    download_links: List[str],
+    table_names: List[str],
+    batch_size: int,
+    conn,
+    schema_name: str,
+    expected_columns: Optional[Dict[str, str]] = None,
+    config: Optional[DataSourceConfig] = None,
+    max_workers: int = MAX_WORKERS,
+) -> None:
+    """
+    Process NHS English Prescriptions CSV files with metadata tracking.
+
+    Files are loaded concurrently, each on its own DuckDB cursor, so one
+    month's download overlaps with another's parse and insert.
+
+    Args:
+        download_links: List of CSV URLs
+        table_names: List of table names
+        batch_size: Batch size for processing
+        conn: Database connection
+        schema_name: Schema name
+        expected_columns: Dict of expected column names and types for validation
+            (fallback if config.get_table_template is not available)
+        config: Data source configuration (enables metadata logging and
+            date-aware schema selection if provided)
+        max_workers: Maximum number of files to process at once
+    """
+    if len(download_links) != len(table_names):
+        raise ValueError(
+            "Number of download links must match the number of table names"
+        )
+
+    if not download_links:
+        return
+
+    def process_with_cursor(csv_url: str, table_name: str) -> None:
+        # DuckDB connections are not safe to share across threads, cursors are
+        cursor = conn.cursor()
+        try:
+            process_prescription_file(
+                csv_url,
+                table_name,
+                batch_size,
+                cursor,
+                schema_name,
+                expected_columns,
+                config,
+            )
+        finally:
+            cursor.close()
+
+    workers = max(1, min(max_workers, len(download_links)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(process_with_cursor, csv_url, table_name)
+            for csv_url, table_name in zip(download_links, table_names)
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
@@ -2,55 +2,88 @@ from loguru import logger
 import time
 import requests
 import os
+import posixpath
 import tempfile
 import zipfile
 import csv
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from ..data_sources.data_source_config import DataProcessorType, DataSourceConfig
 from ..data_processors.utils.metadata_logger import metadata_tracker
 from ..data_processors.utils.data_processor_utils import insert_table
 
+# Values treated as NULL - empty strings only count for numeric columns
+NULL_SENTINELS = ["", "nan", "NaN", "null"]
+STRING_SENTINELS = NULL_SENTINELS[1:]
+NUMERIC_TYPES = frozenset({"BIGINT", "DOUBLE", "INTEGER"})
+
+
+@lru_cache(maxsize=8)
+def split_numeric_columns(
+    expected_items: Tuple[Tuple[str, str], ...],
+) -> Dict[str, str]:
+    """
+    Pick out the numeric columns of a schema, cached per schema.
+
+    Args:
+        expected_items: tuple(expected_columns.items())
+
+    Returns:
+        Dict of numeric column names and their database types
+    """
+    return {col: dtype for col, dtype in expected_items if dtype in NUMERIC_TYPES}
+
 
 def clean_dataframe_for_motherduck(
     df: pd.DataFrame, expected_columns: Dict[str, str]
 ) -> pd.DataFrame:
-    """Clean DataFrame and handle empty strings for numeric columns."""
-    df_clean = df.copy()
+    """
+    Clean DataFrame and handle empty strings for numeric columns.
 
-    numeric_columns = {
-        col: dtype
-        for col, dtype in expected_columns.items()
-        if dtype in ["BIGINT", "DOUBLE", "INTEGER"]
-    }
+    The DataFrame is modified in place; callers pass a freshly built batch.
+    """
+    numeric_columns = split_numeric_columns(tuple(expected_columns.items()))
+    df_columns = frozenset(df.columns)
+    present_numeric = [col for col in numeric_columns if col in df_columns]
 
-    for col, dtype in numeric_columns.items():
-        if col in df_clean.columns:
-            df_clean[col] = df_clean[col].replace(["", "nan", "NaN", "null"], None)
+    # Null every sentinel across the numeric block in one isin/mask pass
+    if present_numeric:
+        numeric_block = df[present_numeric]
+        numeric_block = numeric_block.mask(numeric_block.isin(NULL_SENTINELS))
 
+        for col in present_numeric:
+            dtype = numeric_columns[col]
             if dtype == "BIGINT":
-                numeric_series = pd.to_numeric(df_clean[col], errors="coerce")
-                df_clean[col] = pd.Series(numeric_series).astype("Int64")
+                numeric_series = pd.to_numeric(numeric_block[col], errors="coerce")
+                df[col] = numeric_series.astype("Int64")
             elif dtype == "DOUBLE":
-                df_clean[col] = pd.to_numeric(df_clean[col], errors="coerce")
+                df[col] = pd.to_numeric(numeric_block[col], errors="coerce")
+            else:
+                df[col] = numeric_block[col]
 
-    string_columns = [col for col in df_clean.columns if col not in numeric_columns]
-    for col in string_columns:
-        df_clean[col] = df_clean[col].astype(str).replace(["nan", "NaN", "null"], None)
+    # csv.DictReader already yields strings, so mask the whole string block at once
+    string_columns = [col for col in df.columns if col not in numeric_columns]
+    if string_columns:
+        values = df[string_columns].to_numpy()
+        df[string_columns] = np.where(np.isin(values, STRING_SENTINELS), None, values)
 
-    return df_clean
+    return df
 
 
 def fetch_redirect_url(url: str) -> str:
     """
     Call the redirect url and then fetch the actual download url.
-    This is suboptimal and will change in future versions.
+
+    Only the final response headers are read; the body is left for the
+    download itself.
     """
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        redirect_url = response.url
+        with requests.get(url, stream=True, allow_redirects=True) as response:
+            response.raise_for_status()
+            redirect_url = response.url
     except (requests.exceptions.RequestException, ValueError, Exception):
         logger.error("An error retrieving the redirect URL")
         raise
@@ -106,6 +139,78 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
     return False
 
 
+def build_csv_select(expected_columns: Dict[str, str]) -> str:
+    """
+    Build the SELECT list that types raw CSV columns to match the table.
+
+    Mirrors clean_dataframe_for_motherduck: null sentinels become NULL and
+    numeric values that fail to parse are coerced to NULL.
+
+    Args:
+        expected_columns: Dict of column names and their database types
+
+    Returns:
+        Comma separated SQL expressions in template order
+    """
+    expressions = []
+    for col, dtype in expected_columns.items():
+        quoted = '"' + col.replace('"', '""') + '"'
+        if dtype in NUMERIC_TYPES:
+            expressions.append(
+                f"TRY_CAST(CASE WHEN {quoted} IN ('nan', 'NaN', 'null') THEN NULL "
+                f"ELSE {quoted} END AS {dtype}) AS {quoted}"
+            )
+        else:
+            expressions.append(
+                f"CASE WHEN {quoted} IN ('nan', 'NaN', 'null') THEN NULL "
+                f"ELSE COALESCE({quoted}, '') END AS {quoted}"
+            )
+    return ", ".join(expressions)
+
+
+def insert_csv_file_into_motherduck(
+    csv_file: str, conn, schema: str, table: str, expected_columns: Dict[str, str]
+) -> Tuple[int, int]:
+    """
+    Load a CSV file straight into MotherDuck with DuckDB's native CSV reader.
+
+    Columns are read positionally as VARCHAR, matching the DictReader path, and
+    typed inside the INSERT so no rows pass through Python. Short rows are
+    padded with NULLs; rows that still can't be parsed (too many values, bad
+    encoding) are skipped and counted rather than failing the file.
+
+    Args:
+        csv_file: Path to the extracted CSV file
+        conn: DuckDB connection object
+        schema: Database schema
+        table: Table name
+        expected_columns: Dict of column names and their database types
+
+    Returns:
+        Tuple of (rows inserted, rows skipped)
+    """
+    columns = ", ".join(
+        "'" + col.replace("'", "''") + "': 'VARCHAR'" for col in expected_columns
+    )
+    # The sniffer can't cope with ragged rows, so the dialect is given outright
+    insert_sql = f"""INSERT INTO "{schema}"."{table}"
+        SELECT {build_csv_select(expected_columns)}
+        FROM read_csv(
+            ?, header = true, auto_detect = false, columns = {{{columns}}},
+            null_padding = true, ignore_errors = true, store_rejects = true
+        )"""
+
+    result = conn.execute(insert_sql, [csv_file]).fetchone()
+    inserted = result[0] if result else 0
+
+    skipped = conn.execute(
+        """SELECT count(DISTINCT line) FROM reject_errors
+        WHERE scan_id = (SELECT max(scan_id) FROM reject_scans)"""
+    ).fetchone()[0]
+
+    return inserted, skipped
+
+
 def load_csv_data(
     url: str,
     conn,
@@ -196,19 +301,21 @@ def load_csv_data(
                         zip_file.write(chunk)
                         pbar.update(len(chunk))
 
-            logger.info("Extracting zip file")
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-
+            # Pick the ONSUD CSVs out of the manifest and extract only those
             csv_files = []
-            for root, dirs, files in os.walk(temp_dir):
-                if "Data" in dirs:
-                    data_dir = os.path.join(root, "Data")
-                    for filename in os.listdir(data_dir):
-                        if filename.endswith(".csv") and filename.startswith("ONSUD"):
-                            csv_file_path = os.path.join(data_dir, filename)
-                            csv_files.append(csv_file_path)
-                            logger.info(f"Found CSV file: {filename}")
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                for member in zip_ref.namelist():
+                    filename = posixpath.basename(member)
+                    in_data_dir = (
+                        posixpath.basename(posixpath.dirname(member)) == "Data"
+                    )
+                    if (
+                        in_data_dir
+                        and filename.endswith(".csv")
+                        and filename.startswith("ONSUD")
+                    ):
+                        logger.info(f"Extracting CSV file: {member}")
+                        csv_files.append(zip_ref.extract(member, temp_dir))
 
             if not csv_files:
                 handle_error("No ONSUD CSV files found in the zip archive")
@@ -220,12 +327,29 @@ def load_csv_data(
             for csv_file in csv_files:
                 logger.info(f"Processing file: {os.path.basename(csv_file)}")
 
-                total_lines = sum(1 for _ in open(csv_file))
+                csv_size = os.path.getsize(csv_file)
                 logger.info(
-                    f"Processing {total_lines - 1} rows from {os.path.basename(csv_file)}"
+                    f"Processing {csv_size / 1024 / 1024:.2f} MB from "
+                    f"{os.path.basename(csv_file)}"
                 )
 
-                current_batch = []
+                # DuckDB types and cleans the file itself, no rows pass through pandas
+                if processor_type == DataProcessorType.MOTHERDUCK:
+                    inserted, skipped = insert_csv_file_into_motherduck(
+                        csv_file, conn, schema, name, expected_columns
+                    )
+                    total_rows_processed += inserted
+                    if skipped:
+                        handle_error(
+                            f"Skipped {skipped} malformed rows in "
+                            f"{os.path.basename(csv_file)}"
+                        )
+                    logger.info(f"Loaded {total_rows_processed} rows so far")
+                    continue
+
+                # Fixed-size buffer reused across batches, filled via a write cursor
+                current_batch = [None] * batch_limit
+                cursor = 0
                 with open(csv_file, "r", newline="") as file:
                     reader = csv.DictReader(file, fieldnames=fieldnames)
                     next(reader)
@@ -233,24 +357,25 @@ def load_csv_data(
                     for i, row in enumerate(
                         tqdm(
                             reader,
-                            total=total_lines - 1,
+                            unit="rows",
                             desc=f"Processing {os.path.basename(csv_file)}",
                         ),
                         1,
                     ):
                         try:
-                            current_batch.append(row)
+                            current_batch[cursor] = row
+                            cursor += 1
 
-                            if len(current_batch) >= batch_limit:
+                            if cursor == batch_limit:
                                 process_batch(current_batch)
-                                current_batch = []
+                                cursor = 0
 
                         except Exception as e:
                             handle_error("Error processing row", e, i)
                             continue
 
-                    if current_batch:
-                        process_batch(current_batch, is_final=True)
+                    if cursor:
+                        process_batch(current_batch[:cursor], is_final=True)
 
     except Exception as e:
         handle_error("Error processing the zip file", e)
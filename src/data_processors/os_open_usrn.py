@@ -1,26 +1,48 @@
 import requests
 import os
 import tempfile
-import zipfile
-import pandas as pd
-import fiona
-from shapely import wkt
-from shapely.geometry import shape
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyogrio
+import shapely
 from loguru import logger
 from tqdm import tqdm
 import time
-from typing import Optional
-
+from typing import List, Optional, Tuple
+from urllib3.exceptions import HTTPError as Urllib3Error
+
+from ..data_processors.utils.data_processor_utils import (
+    extract_geopackage,
+    prefetch_batches,
+    tune_batch_size,
+)
 from ..data_processors.utils.metadata_logger import metadata_tracker
 from ..data_sources.data_source_config import DataSourceConfig
 
+# Read straight from the urllib3 stream in large blocks rather than through
+# requests' iter_content chunking
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+RANGE_DOWNLOAD_WORKERS = 8
+# Below this size a single stream is as quick as splitting into ranges
+MIN_RANGE_DOWNLOAD_SIZE = 64 * 1024 * 1024
+# Reading response.raw surfaces urllib3's own errors (ProtocolError,
+# ReadTimeoutError) rather than the requests wrappers
+DOWNLOAD_ERRORS = (
+    requests.exceptions.RequestException,
+    Urllib3Error,
+    OSError,
+    ValueError,
+)
+
 
 def insert_into_motherduck(df, conn, schema: str, table: str):
     """
     Processes dataframe into MotherDuck table with retry logic
 
     Args:
-        df: DataFrame to insert
+        df: DataFrame or Arrow Table to insert, columns in table order
         conn: Connection object
         schema: Schema name
         table: Table name
@@ -32,14 +54,14 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
         logger.error("No connection provided")
         return None
 
+    # Bind the input once; retries reuse the same relation
+    relation = conn.from_arrow(df) if isinstance(df, pa.Table) else conn.from_df(df)
+
     for attempt in range(max_retries):
         try:
             logger.info(f"Attempting to insert into schema: {schema}, table: {table}")
 
-            conn.register("df_temp", df)
-
-            insert_sql = f"""INSERT INTO "{schema}"."{table}" SELECT * FROM df_temp"""
-            conn.execute(insert_sql)
+            relation.insert_into(f'"{schema}"."{table}"')
 
             if attempt > 0:
                 logger.success(f"Successfully inserted data on attempt {attempt + 1}")
@@ -48,11 +70,6 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
             return None
 
         except Exception as e:
-            try:
-                conn.unregister("df_temp")
-            except Exception:
-                pass
-
             if attempt < max_retries - 1:
                 wait_time = (2**attempt) * base_delay
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
@@ -68,12 +85,14 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
 def fetch_redirect_url(url: str) -> str:
     """
     Call the redirect url and then fetch the actual download url.
-    This is suboptimal and will change in future versions.
+
+    Only the final response headers are read; the body is left for the
+    download itself.
     """
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        redirect_url = response.url
+        with requests.get(url, stream=True, allow_redirects=True) as response:
+            response.raise_for_status()
+            redirect_url = response.url
         logger.success(f"The Redirect URL is: {redirect_url}")
     except (requests.exceptions.RequestException, ValueError, Exception) as e:
         logger.error(f"An error retrieving the redirect URL: {e}")
@@ -81,6 +100,192 @@ def fetch_redirect_url(url: str) -> str:
     return redirect_url
 
 
+def split_byte_ranges(size: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file size into contiguous inclusive byte ranges.
+
+    Args:
+        size: Total number of bytes
+        parts: Number of ranges to produce
+
+    Returns:
+        List of (start, end) pairs covering bytes 0 to size - 1
+    """
+    step = -(-size // parts)
+    return [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+
+def write_response_body(response: requests.Response, local_file) -> int:
+    """
+    Copy a streamed response body into an open file.
+
+    Reads the underlying urllib3 stream directly, still decoding any
+    content-encoding, in DOWNLOAD_CHUNK_SIZE blocks.
+
+    Args:
+        response: Response opened with stream=True
+        local_file: File object positioned where the body should go
+
+    Returns:
+        Number of bytes written
+    """
+    response.raw.decode_content = True
+    written = 0
+
+    while chunk := response.raw.read(DOWNLOAD_CHUNK_SIZE):
+        local_file.write(chunk)
+        written += len(chunk)
+
+    return written
+
+
+def download_range(url: str, path: str, byte_range: Tuple[int, int]) -> int:
+    """
+    Download one byte range of a file into the same offset of a local file.
+
+    Args:
+        url: URL of the file
+        path: Local file, already allocated to the full size
+        byte_range: Inclusive (start, end) byte offsets
+
+    Returns:
+        Number of bytes written
+    """
+    start, end = byte_range
+
+    with requests.get(
+        url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=60
+    ) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise ValueError(f"Range request returned status {response.status_code}")
+
+        with open(path, "r+b") as local_file:
+            local_file.seek(start)
+            written = write_response_body(response, local_file)
+
+    if written != end - start + 1:
+        raise ValueError(f"Range {start}-{end} returned {written} bytes")
+
+    return written
+
+
+def download_file(url: str, path: str) -> int:
+    """
+    Download a file to disk, in parallel byte ranges when the server allows it.
+
+    Falls back to a single stream when the server does not advertise range
+    support, the file is small, or any range fails.
+
+    Args:
+        url: URL of the file
+        path: Local path to write to
+
+    Returns:
+        Size of the downloaded file in bytes
+    """
+    try:
+        head = requests.head(url, allow_redirects=True, timeout=30)
+        head.raise_for_status()
+        total_size = int(head.headers.get("content-length", 0))
+        accepts_ranges = head.headers.get("accept-ranges", "").lower() == "bytes"
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"HEAD request failed, downloading as a single stream: {e}")
+        total_size, accepts_ranges = 0, False
+
+    if accepts_ranges and total_size >= MIN_RANGE_DOWNLOAD_SIZE:
+        logger.info(
+            f"Downloading {total_size:,} bytes in {RANGE_DOWNLOAD_WORKERS} ranges"
+        )
+        with open(path, "wb") as local_file:
+            local_file.truncate(total_size)
+
+        try:
+            with ThreadPoolExecutor(max_workers=RANGE_DOWNLOAD_WORKERS) as executor:
+                list(
+                    executor.map(
+                        lambda byte_range: download_range(head.url, path, byte_range),
+                        split_byte_ranges(total_size, RANGE_DOWNLOAD_WORKERS),
+                    )
+                )
+            return total_size
+        except DOWNLOAD_ERRORS as e:
+            logger.warning(f"Range download failed, retrying as a single stream: {e}")
+
+    # Stream the file to disk so it is never held in memory in full
+    with requests.get(url, stream=True) as response:
+        response.raise_for_status()
+        with open(path, "wb") as local_file:
+            return write_response_body(response, local_file)
+
+
+def geometry_batch_to_wkb(
+    batch: pa.RecordBatch, geometry_column: str, offset: int, errors: list
+) -> pa.Table:
+    """
+    Validate the WKB geometry column of a GeoPackage batch and keep it as WKB.
+
+    The bytes are passed through untouched, so there is no text encoding on
+    the way in; geometries that cannot be parsed are stored as NULL.
+
+    Args:
+        batch: Arrow batch read from the GeoPackage
+        geometry_column: Name of the WKB geometry column in the batch
+        offset: Index of the first feature in the batch, used in warnings
+        errors: List that conversion errors are appended to
+
+    Returns:
+        Arrow Table of the attribute columns plus a WKB "geometry" column
+    """
+    wkb = batch.column(geometry_column)
+    geometries = shapely.from_wkb(
+        wkb.to_numpy(zero_copy_only=False), on_invalid="ignore"
+    )
+
+    # Features that had geometry but could not be parsed
+    has_wkb = wkb.is_valid().to_numpy(zero_copy_only=False)
+    invalid = shapely.is_missing(geometries) & has_wkb
+    for i in np.flatnonzero(invalid):
+        error_msg = f"Error converting geometry for feature {offset + i}"
+        logger.warning(error_msg)
+        errors.append(error_msg)
+
+    if invalid.any():
+        wkb = pc.if_else(pa.array(invalid), pa.scalar(None, wkb.type), wkb)
+
+    table_chunk = pa.Table.from_batches([batch]).drop_columns([geometry_column])
+    return table_chunk.append_column("geometry", wkb)
+
+
+def align_to_table(table_chunk: pa.Table, table_columns: List[str]) -> pa.Table:
+    """
+    Reorder a batch to the table's column order, matching names like BY NAME.
+
+    Names are matched case-insensitively and table columns missing from the
+    batch are filled with NULL, so the batch can be inserted positionally.
+
+    Args:
+        table_chunk: Converted GeoPackage batch
+        table_columns: Column names of the target table, in order
+
+    Returns:
+        Arrow Table with one column per table column
+    """
+    by_name = {name.lower(): name for name in table_chunk.column_names}
+
+    extra = by_name.keys() - {name.lower() for name in table_columns}
+    if extra:
+        raise ValueError(f"Columns not in target table: {', '.join(sorted(extra))}")
+
+    columns = [
+        table_chunk.column(by_name[name.lower()])
+        if name.lower() in by_name
+        else pa.nulls(table_chunk.num_rows)
+        for name in table_columns
+    ]
+    return pa.Table.from_arrays(columns, names=table_columns)
+
+
 def load_geopackage_open_usrns(
     url: str, conn, batch_size: int, schema: str, table: str, tracker=None
 ):
@@ -93,90 +298,86 @@ def load_geopackage_open_usrns(
         Url for data
         Connection object
     """
-    chunk_size = batch_size
     errors = []
 
     try:
         logger.info("Downloading zip file...")
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-
-        file_size = len(response.content)
-        if tracker:
-            tracker.set_file_size(file_size)
 
         with tempfile.TemporaryDirectory() as temp_dir:
             zip_path = os.path.join(temp_dir, "temp.zip")
-            with open(zip_path, "wb") as zip_file:
-                zip_file.write(response.content)
-
-            logger.info("Extracting zip file...")
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            gpkg_file = None
-            for root, dirs, files in os.walk(temp_dir):
-                logger.info(f"Searching in directory: {root}")
-                logger.info(f"Found files: {files}")
-                for file_name in files:
-                    if file_name.endswith(".gpkg"):
-                        gpkg_file = os.path.join(root, file_name)
-                        logger.success(f"Found GeoPackage file: {gpkg_file}")
-                        break
-                if gpkg_file:
-                    break
+            file_size = download_file(url, zip_path)
+
+            if tracker:
+                tracker.set_file_size(file_size)
+
+            logger.info("Extracting GeoPackage...")
+            gpkg_file = extract_geopackage(zip_path, temp_dir)
+            if gpkg_file:
+                logger.success(f"Found GeoPackage file: {gpkg_file}")
 
             if gpkg_file:
                 try:
-                    with fiona.open(gpkg_file, "r") as src:
-                        crs = src.crs
-                        data_schema = src.schema
-
-                        logger.info(f"The CRS is: {crs}")
-                        logger.info(f"The Data Schema is: {data_schema}")
-
-                        total_features = len(src)
-                        if tracker:
-                            tracker.set_rows_processed(total_features)
-                            tracker.add_info("total_features", total_features)
-                            tracker.add_info("batch_size", batch_size)
-                            tracker.add_info("file_format", "geopackage")
-                            tracker.add_info("crs", str(crs))
-
-                        features = []
-
-                        for i, feature in enumerate(
-                            tqdm(src, total=total_features, desc="Processing features")
-                        ):
-                            try:
-                                geom = shape(feature["geometry"])
-                                feature["properties"]["geometry"] = wkt.dumps(geom)
-                            except Exception as e:
-                                feature["properties"]["geometry"] = None
-                                error_msg = (
-                                    f"Error converting geometry for feature {i}: {e}"
+                    info = pyogrio.read_info(gpkg_file)
+                    crs = info["crs"]
+                    total_features = info["features"]
+
+                    logger.info(f"The CRS is: {crs}")
+                    logger.info(
+                        f"The Data Schema is: {dict(zip(info['fields'], info['dtypes']))}"
+                    )
+
+                    # Size batches from the layer width, plus the geometry column
+                    chunk_size = tune_batch_size(len(info["fields"]) + 1)
+                    logger.info(f"Reading in batches of {chunk_size:,} features")
+
+                    if tracker:
+                        tracker.set_rows_processed(total_features)
+                        tracker.add_info("total_features", total_features)
+                        tracker.add_info("batch_size", chunk_size)
+                        tracker.add_info("file_format", "geopackage")
+                        tracker.add_info("crs", str(crs))
+
+                    # Resolve the table layout once instead of per insert
+                    table_columns = conn.table(f'"{schema}"."{table}"').columns
+
+                    # Only read the fields the table keeps
+                    wanted = {name.lower() for name in table_columns}
+                    fields = [name for name in info["fields"] if name.lower() in wanted]
+                    skipped = [name for name in info["fields"] if name not in fields]
+                    if skipped:
+                        logger.warning(f"Skipping fields not in table: {skipped}")
+
+                    with pyogrio.open_arrow(
+                        gpkg_file,
+                        columns=fields,
+                        batch_size=chunk_size,
+                        use_pyarrow=True,
+                    ) as (meta, reader):
+                        geometry_column = meta["geometry_name"] or "wkb_geometry"
+
+                        def convert_batches():
+                            offset = 0
+                            for batch in reader:
+                                table_chunk = geometry_batch_to_wkb(
+                                    batch, geometry_column, offset, errors
                                 )
-                                logger.warning(error_msg)
-                                errors.append(error_msg)
-
-                            features.append(feature["properties"])
+                                yield offset, align_to_table(table_chunk, table_columns)
+                                offset += batch.num_rows
+
+                        # Read and convert the next batch while this one is inserted
+                        with tqdm(
+                            total=total_features, desc="Processing features"
+                        ) as pbar:
+                            for processed, table_chunk in prefetch_batches(
+                                convert_batches()
+                            ):
+                                insert_into_motherduck(table_chunk, conn, schema, table)
 
-                            if len(features) == chunk_size:
-                                df_chunk = pd.DataFrame(features)
-                                insert_into_motherduck(df_chunk, conn, schema, table)
                                 logger.info(
-                                    f"Processed features {i - chunk_size + 1} to {i}"
+                                    f"Processed features {processed} to "
+                                    f"{processed + table_chunk.num_rows - 1}"
                                 )
-
-                                features = []
-
-                        if features:
-                            df_chunk = pd.DataFrame(features)
-                            insert_into_motherduck(df_chunk, conn, schema, table)
-                            logger.info(
-                                f"Processed remaining features: {len(features)}"
-                            )
-                            features = []
+                                pbar.update(table_chunk.num_rows)
 
                 except Exception as e:
                     error_msg = f"Error processing GeoPackage: {e}"
@@ -5,7 +5,7 @@ import os
 import tempfile
 import zipfile
 import csv
-import pandas as pd
+import pyarrow as pa
 from tqdm import tqdm
 from typing import Optional
 from ..data_sources.data_source_config import DataProcessorType, DataSourceConfig
@@ -18,11 +18,11 @@ from ..data_processors.utils.data_processor_utils import insert_table
 
 def insert_into_motherduck(df, conn, schema: str, table: str):
     """
-    Takes a connection object and a dataframe
-    Processes dataframe into MotherDuck table with retry logic
+    Takes a connection object and an Arrow table or dataframe
+    Processes it into MotherDuck table with retry logic
 
     Args:
-        df: Dataframe to process
+        df: Arrow table or dataframe to process
         conn: Connection object
         schema: Database schema
         table: Table name
@@ -34,13 +34,13 @@ def insert_into_motherduck(df, conn, schema: str, table: str):
         logger.error("No connection provided")
         return None
 
+    # Bind the input once; retries reuse the same relation
+    relation = conn.from_arrow(df) if isinstance(df, pa.Table) else conn.from_df(df)
+
     def attempt_insert(retry_count):
         """Closure for handling a single insert attempt with logging"""
         try:
-            conn.register("temp_df", df)
-
-            insert_sql = f"""INSERT INTO "{schema}"."{table}" SELECT * FROM temp_df"""
-            conn.execute(insert_sql)
+            relation.insert_into(f'"{schema}"."{table}"')
 
             if retry_count > 0:
                 logger.success(
@@ -95,6 +95,9 @@ def load_csv_data(
         "CONFIDENCE",
     ]
 
+    # Rows are kept as strings, DuckDB casts them to the table's types on insert
+    arrow_schema = pa.schema([(field, pa.string()) for field in fieldnames])
+
     errors = []
     total_rows_processed = 0
     file_size = 0
@@ -118,8 +121,15 @@ def load_csv_data(
             return
 
         try:
-            df_chunk = pd.DataFrame(batch)
-            insert_table(df_chunk, conn, schema, name, processor_type)
+            # Hand MotherDuck an Arrow table so DuckDB can scan it without
+            # converting pandas object columns first
+            table_chunk = pa.Table.from_pylist(batch, schema=arrow_schema)
+            if processor_type == DataProcessorType.MOTHERDUCK:
+                insert_into_motherduck(table_chunk, conn, schema, name)
+            else:
+                insert_table(
+                    table_chunk.to_pandas(), conn, schema, name, processor_type
+                )
 
             batch_size = len(batch)
             total_rows_processed += batch_size
@@ -156,51 +166,51 @@ def load_csv_data(
                         zip_file.write(chunk)
                         pbar.update(len(chunk))
 
-            logger.info("Extracting zip file")
+            # Find the CSV in the manifest and extract only that
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            # Find CSV file
-            csv_file = next(
-                (
-                    os.path.join(temp_dir, f)
-                    for f in os.listdir(temp_dir)
-                    if f.endswith(".csv")
-                ),
-                None,
-            )
+                csv_member = next(
+                    (
+                        member
+                        for member in zip_ref.namelist()
+                        if "/" not in member and member.endswith(".csv")
+                    ),
+                    None,
+                )
+                csv_file = zip_ref.extract(csv_member, temp_dir) if csv_member else None
 
             if not csv_file:
                 handle_error("No CSV file found in the zip archive")
                 raise FileNotFoundError("No CSV file found in the zip archive")
 
-            # Get total line count for progress bar
-            total_lines = sum(1 for _ in open(csv_file))
-            logger.info(f"Processing {total_lines - 1} rows from CSV")  # -1 for header
+            csv_size = os.path.getsize(csv_file)
+            logger.info(f"Processing {csv_size / 1024 / 1024:.2f} MB from CSV")
 
             # Process CSV data
-            current_batch = []
+            # Fixed-size buffer reused across batches, filled via a write cursor
+            current_batch = [None] * batch_limit
+            cursor = 0
             with open(csv_file, "r", newline="") as file:
                 reader = csv.DictReader(file, fieldnames=fieldnames)
                 next(reader)  # Skip header
 
                 for i, row in enumerate(
-                    tqdm(reader, total=total_lines - 1, desc="Processing rows"), 1
+                    tqdm(reader, unit="rows", desc="Processing rows"), 1
                 ):
                     try:
-                        current_batch.append(row)
+                        current_batch[cursor] = row
+                        cursor += 1
 
-                        if len(current_batch) >= batch_limit:
+                        if cursor == batch_limit:
                             process_batch(current_batch)
-                            current_batch = []
+                            cursor = 0
 
                     except Exception as e:
                         handle_error("Error processing row", e, i)
                         continue
 
                 # Process remaining rows
-                if current_batch:
-                    process_batch(current_batch, is_final=True)
+                if cursor:
+                    process_batch(current_batch[:cursor], is_final=True)
 
     except Exception as e:
         handle_error("Error processing the zip file", e)
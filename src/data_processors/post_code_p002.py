@@ -1,18 +1,51 @@
 import csv
-import pandas as pd
+import io
+import queue
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from typing import Iterator, List, Dict, Tuple, Optional
 import requests
 from loguru import logger
 from tqdm import tqdm
 import time
+from ..data_processors.utils.data_processor_utils import (
+    RETRYABLE_ERRORS,
+    ChunkStream,
+    load_httpfs,
+    skip_invalid_row,
+    tune_batch_size,
+)
 from ..data_processors.utils.metadata_logger import metadata_tracker
 from ..data_sources.data_source_config import DataSourceConfig
 
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+# Files loaded at once, each into its own table
+MAX_WORKERS = 4
+# Parsed batches allowed to wait for the inserter thread
+INSERT_QUEUE_SIZE = 2
+# Assumed table width when no expected columns are given
+DEFAULT_COLUMN_COUNT = 20
 
-def insert_into_motherduck(df: pd.DataFrame, conn, schema: str, table: str) -> bool:
+# Values treated as NULL - empty strings only count for numeric columns
+NULL_SENTINELS = ["", "nan", "NaN", "null"]
+STRING_SENTINELS = NULL_SENTINELS[1:]
+NUMERIC_COLUMN_TYPES = frozenset({"BIGINT", "DOUBLE", "INTEGER"})
+POLARS_TYPES = {"BIGINT": pl.Int64, "DOUBLE": pl.Float64}
+
+
+def insert_into_motherduck(df: pl.DataFrame, conn, schema: str, table: str) -> bool:
     """
     Insert DataFrame into MotherDuck with retry logic.
 
+    The frame is appended as an Arrow table through a DuckDB relation rather
+    than registering a view and building an INSERT statement for every batch.
+    Only connection, IO and transaction errors are retried; schema and type
+    errors are raised straight away since retrying cannot fix them.
+
     Args:
         df: DataFrame to insert
         conn: Database connection
@@ -29,33 +62,28 @@ def insert_into_motherduck(df: pd.DataFrame, conn, schema: str, table: str) -> b
         logger.error("No connection provided")
         return False
 
+    # Polars frames are Arrow backed, so this hands DuckDB the buffers as-is
+    arrow_table = df.to_arrow()
+
     for attempt in range(max_retries):
         try:
-            conn.register("temp_df", df)
-            insert_sql = f"""INSERT INTO "{schema}"."{table}" SELECT * FROM temp_df"""
-            conn.execute(insert_sql)
+            conn.from_arrow(arrow_table).insert_into(f'"{schema}"."{table}"')
 
             if attempt > 0:
                 logger.success(f"Successfully inserted data on attempt {attempt + 1}")
 
             return True
 
-        except Exception as e:
-            conn.unregister("temp_df")
-
+        except RETRYABLE_ERRORS as e:
             if attempt < max_retries - 1:
-                wait_time = (2**attempt) * base_delay
+                # Jitter keeps concurrent loaders from retrying in lockstep
+                wait_time = (2**attempt) * base_delay * random.uniform(0.8, 1.2)
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                logger.info(f"Retrying in {wait_time} seconds...")
+                logger.info(f"Retrying in {wait_time:.1f} seconds...")
                 time.sleep(wait_time)
             else:
                 logger.error(f"All {max_retries} attempts failed. Final error: {e}")
                 raise
-        finally:
-            try:
-                conn.unregister("temp_df")
-            except Exception:
-                pass
 
     return False
 
@@ -89,34 +117,53 @@ def validate_column_names(
     return len(issues) == 0, issues
 
 
-def clean_dataframe_for_motherduck(
-    df: pd.DataFrame, expected_columns: Dict[str, str]
-) -> pd.DataFrame:
-    """Clean DataFrame and rename columns to SQL-safe names."""
-    df_clean = df.copy()
+@lru_cache(maxsize=8)
+def build_clean_expressions(
+    columns: Tuple[str, ...], expected_items: Tuple[Tuple[str, str], ...]
+) -> Tuple[pl.Expr, ...]:
+    """
+    Build the Polars cleaning expressions for a batch layout, cached per layout.
 
+    Args:
+        columns: Column names of the batch
+        expected_items: tuple(expected_columns.items())
+
+    Returns:
+        One expression per column masking sentinels and casting numeric types
+    """
     numeric_columns = {
-        col: dtype
-        for col, dtype in expected_columns.items()
-        if dtype in ["BIGINT", "DOUBLE", "INTEGER"]
+        col: dtype for col, dtype in expected_items if dtype in NUMERIC_COLUMN_TYPES
     }
 
-    for col, dtype in numeric_columns.items():
-        if col in df_clean.columns:
-            df_clean[col] = df_clean[col].replace(["", "nan", "NaN", "null"], None)
+    expressions = []
+    for col in columns:
+        dtype = numeric_columns.get(col)
+        sentinels = STRING_SENTINELS if dtype is None else NULL_SENTINELS
+        expression = (
+            pl.when(pl.col(col).is_in(sentinels)).then(None).otherwise(pl.col(col))
+        )
+        if dtype in POLARS_TYPES:
+            expression = expression.str.strip_chars().cast(
+                POLARS_TYPES[dtype], strict=False
+            )
+        expressions.append(expression.alias(col))
 
-            if dtype == "BIGINT":
-                df_clean[col] = pd.to_numeric(df_clean[col], errors="coerce").astype(
-                    "Int64"
-                )
-            elif dtype == "DOUBLE":
-                df_clean[col] = pd.to_numeric(df_clean[col], errors="coerce")
+    return tuple(expressions)
 
-    string_columns = [col for col in df_clean.columns if col not in numeric_columns]
-    for col in string_columns:
-        df_clean[col] = df_clean[col].astype(str).replace(["nan", "NaN", "null"], None)
 
-    return df_clean
+def clean_dataframe_for_motherduck(
+    df: pl.DataFrame, expected_columns: Dict[str, str]
+) -> pl.DataFrame:
+    """
+    Clean DataFrame and rename columns to SQL-safe names.
+
+    All columns are rewritten in one Polars with_columns call so the
+    sentinel masking and numeric casts run as columnar expressions.
+    """
+    expressions = build_clean_expressions(
+        tuple(df.columns), tuple(expected_columns.items())
+    )
+    return df.with_columns(expressions)
 
 
 def stream_csv_from_url(
@@ -124,10 +171,13 @@ def stream_csv_from_url(
     batch_size: int,
     expected_columns: Optional[Dict[str, str]] = None,
     tracker=None,
-) -> Iterator[pd.DataFrame]:
+) -> Iterator[pl.DataFrame]:
     """
     Stream CSV data directly from a URL with optional column validation.
 
+    The response body is parsed by PyArrow's streaming CSV reader, so rows
+    never pass through Python one at a time.
+
     Args:
         csv_url: URL of the CSV file
         batch_size: Number of rows per batch
@@ -143,103 +193,235 @@ def stream_csv_from_url(
 
         total_size = int(response.headers.get("content-length", 0))
 
-        row_buffer = []
-        header = None
-        partial_line = ""
-
         if tracker:
             tracker.set_file_size(total_size)
 
-        with tqdm(
-            total=total_size, unit="B", unit_scale=True, desc="Streaming CSV"
-        ) as pbar:
-            for chunk in response.iter_content(chunk_size=1048576):
-                if chunk:
-                    pbar.update(len(chunk))
-
-                    try:
-                        text_chunk = chunk.decode("utf-8", errors="ignore")
-                    except UnicodeDecodeError:
-                        logger.warning("Failed to decode chunk as UTF-8, skipping")
-                        continue
-
-                    text_chunk = partial_line + text_chunk
-                    lines = text_chunk.split("\n")
-                    partial_line = lines[-1]
-                    lines = lines[:-1]
-
-                    for line in lines:
-                        if not line.strip():
-                            continue
-
-                        if header is None:
-                            # Parse header
-                            header = next(csv.reader([line]))
-                            logger.info(f"Found {len(header)} columns: {header[:5]}...")
-
-                            # Validate columns if expected_columns provided
-                            if expected_columns:
-                                is_valid, issues = validate_column_names(
-                                    header, expected_columns
-                                )
-
-                                if not is_valid:
-                                    logger.error("Column validation failed:")
-                                    for issue in issues:
-                                        logger.error(f"  - {issue}")
-                                    raise ValueError("Invalid columns in CSV")
-                                else:
-                                    logger.info("✓ Column validation passed")
-
-                        else:
-                            try:
-                                values = next(csv.reader([line]))
-                                if len(values) == len(header):
-                                    row_dict = dict(zip(header, values))
-                                    row_buffer.append(row_dict)
-
-                                    if len(row_buffer) >= batch_size:
-                                        df_batch = pd.DataFrame(row_buffer)
-                                        if expected_columns:
-                                            df_batch = clean_dataframe_for_motherduck(
-                                                df_batch, expected_columns
-                                            )
-                                        yield df_batch
-                                        row_buffer = []
-                                        logger.debug(
-                                            f"Yielded batch of {batch_size} rows"
-                                        )
-                                else:
-                                    logger.warning(
-                                        f"Row has {len(values)} values but header has {len(header)} columns"
-                                    )
-                            except csv.Error as e:
-                                logger.warning(f"Error parsing CSV line: {e}")
-                                continue
-
-            if partial_line.strip() and header:
-                try:
-                    values = next(csv.reader([partial_line]))
-                    if len(values) == len(header):
-                        row_dict = dict(zip(header, values))
-                        row_buffer.append(row_dict)
-                except csv.Error:
-                    pass
-
-            if row_buffer:
-                df_batch = pd.DataFrame(row_buffer)
-                if expected_columns:
-                    df_batch = clean_dataframe_for_motherduck(
-                        df_batch, expected_columns
-                    )
-                yield df_batch
-                logger.debug(f"Yielded final batch of {len(row_buffer)} rows")
+        # Invalid UTF-8 bytes are dropped, as Arrow would reject the file
+        csv_file = io.BufferedReader(
+            ChunkStream(
+                response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE),
+                errors="ignore",
+            ),
+            buffer_size=DOWNLOAD_CHUNK_SIZE,
+        )
+
+        # Read the header ourselves so every column can be typed as a string
+        header = next(
+            csv.reader([csv_file.readline().decode("utf-8-sig").rstrip("\r\n")])
+        )
+        logger.info(f"Found {len(header)} columns: {header[:5]}...")
+
+        # Validate columns if expected_columns provided
+        if expected_columns:
+            is_valid, issues = validate_column_names(header, expected_columns)
+
+            if not is_valid:
+                logger.error("Column validation failed:")
+                for issue in issues:
+                    logger.error(f"  - {issue}")
+                raise ValueError("Invalid columns in CSV")
+            else:
+                logger.info("✓ Column validation passed")
+
+        string_schema = pa.schema([(name, pa.string()) for name in header])
+        reader = pacsv.open_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(
+                block_size=DOWNLOAD_CHUNK_SIZE, column_names=header
+            ),
+            parse_options=pacsv.ParseOptions(invalid_row_handler=skip_invalid_row),
+            convert_options=pacsv.ConvertOptions(column_types=string_schema),
+        )
+
+        def build_batch(record_batches: List[pa.RecordBatch]) -> pl.DataFrame:
+            df_batch = pl.from_arrow(
+                pa.Table.from_batches(record_batches, schema=string_schema)
+            )
+            if expected_columns:
+                df_batch = clean_dataframe_for_motherduck(df_batch, expected_columns)
+            return df_batch
+
+        batch_buffer = []
+        buffered_rows = 0
+
+        with tqdm(unit="rows", unit_scale=True, desc="Streaming CSV") as pbar:
+            for record_batch in reader:
+                pbar.update(record_batch.num_rows)
+                batch_buffer.append(record_batch)
+                buffered_rows += record_batch.num_rows
+
+                if buffered_rows >= batch_size:
+                    yield build_batch(batch_buffer)
+                    logger.debug(f"Yielded batch of {buffered_rows} rows")
+                    batch_buffer = []
+                    buffered_rows = 0
+
+        if batch_buffer:
+            yield build_batch(batch_buffer)
+            logger.debug(f"Yielded final batch of {buffered_rows} rows")
 
     except Exception as e:
         logger.error(f"Error streaming CSV file {csv_url}: {e}")
         raise
 
 
+def build_csv_select(header: List[str], expected_columns: Dict[str, str]) -> str:
+    """
+    Build a SELECT list that cleans an all-VARCHAR CSV inside DuckDB.
+
+    Mirrors clean_dataframe_for_motherduck: sentinels become NULL, empty text
+    fields stay "" and numeric columns are cast, with unparseable values
+    turned into NULL.
+
+    Args:
+        header: Column names from the CSV
+        expected_columns: Dict of expected column names and types
+
+    Returns:
+        Comma separated SELECT expressions, one per CSV column
+    """
+    numeric_columns = {
+        col: dtype
+        for col, dtype in expected_columns.items()
+        if dtype in NUMERIC_COLUMN_TYPES
+    }
+    null_list = ", ".join(f"'{value}'" for value in NULL_SENTINELS)
+    string_null_list = ", ".join(f"'{value}'" for value in STRING_SENTINELS)
+
+    select_list = []
+    for name in header:
+        target = name
+        quoted = '"' + name.replace('"', '""') + '"'
+        dtype = numeric_columns.get(target)
+
+        if dtype is None:
+            # read_csv loads empty fields as NULL, Arrow keeps them as ""
+            expression = (
+                f"CASE WHEN {quoted} IN ({string_null_list}) THEN NULL "
+                f"ELSE COALESCE({quoted}, '') END"
+            )
+        elif dtype in POLARS_TYPES:
+            expression = (
+                f"TRY_CAST(CASE WHEN {quoted} IN ({null_list}) THEN NULL "
+                f"ELSE trim({quoted}) END AS {dtype})"
+            )
+        else:
+            expression = (
+                f"CASE WHEN {quoted} IN ({null_list}) THEN NULL ELSE {quoted} END"
+            )
+
+        select_list.append(f'{expression} AS "{target}"')
+
+    return ", ".join(select_list)
+
+
+def insert_csv_url_into_motherduck(
+    url: str,
+    conn,
+    schema_name: str,
+    table_name: str,
+    expected_columns: Optional[Dict[str, str]] = None,
+) -> int:
+    """
+    Load a CSV URL into MotherDuck with DuckDB's native CSV reader.
+
+    Columns are read as VARCHAR, the same as the streaming path. With
+    expected_columns they are cleaned by build_csv_select, otherwise the
+    INSERT casts them to the table types.
+
+    Args:
+        url: URL of the CSV file
+        conn: Database connection
+        schema_name: Schema name
+        table_name: Table name
+        expected_columns: Dict of expected column names and types for validation
+
+    Returns:
+        Number of rows inserted
+    """
+    source_sql = "read_csv(?, header = true, all_varchar = true)"
+    select_sql = "*"
+
+    if expected_columns:
+        header = [
+            column[0]
+            for column in conn.execute(
+                f"SELECT * FROM {source_sql} LIMIT 0", [url]
+            ).description
+        ]
+        is_valid, issues = validate_column_names(header, expected_columns)
+        if not is_valid:
+            logger.error("Column validation failed:")
+            for issue in issues:
+                logger.error(f"  - {issue}")
+            raise ValueError("Invalid columns in CSV")
+        logger.info("✓ Column validation passed")
+
+        select_sql = build_csv_select(header, expected_columns)
+
+    result = conn.execute(
+        f"""INSERT INTO "{schema_name}"."{table_name}" SELECT {select_sql} FROM {source_sql}""",
+        [url],
+    ).fetchone()
+    return result[0] if result else 0
+
+
+def insert_batches_from_queue(
+    batch_queue: queue.Queue,
+    conn,
+    schema_name: str,
+    table_name: str,
+    errors: List[str],
+    tracker=None,
+) -> Tuple[int, int]:
+    """
+    Insert batches taken from a queue until the None sentinel arrives.
+
+    Runs on the inserter thread, so conn should be a cursor dedicated to it.
+    Failed batches are logged and recorded in errors rather than raised.
+
+    Args:
+        batch_queue: Queue of DataFrames, terminated by None
+        conn: Database cursor owned by this thread
+        schema_name: Schema name
+        table_name: Table name
+        errors: List collecting batch error messages
+        tracker: Optional metadata tracker
+
+    Returns:
+        Tuple of (total_rows_inserted, batch_count)
+    """
+    total_rows = 0
+    batch_count = 0
+
+    while True:
+        df_batch = batch_queue.get()
+        if df_batch is None:
+            break
+
+        batch_count += 1
+        batch_rows = len(df_batch)
+
+        try:
+            insert_into_motherduck(df_batch, conn, schema_name, table_name)
+
+            total_rows += batch_rows
+            logger.info(
+                f"Processed batch {batch_count} ({batch_rows} rows, {total_rows} total)"
+            )
+
+            if tracker and batch_count % 10 == 0:
+                tracker.add_info("batches_processed", batch_count)
+                tracker.add_info("current_total_rows", total_rows)
+
+        except Exception as e:
+            error_msg = f"Error processing batch {batch_count}: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+    return total_rows, batch_count
+
+
 def process_streaming_csv(
     url: str,
     batch_size: int,
@@ -280,27 +462,50 @@ def process_streaming_csv(
     try:
         logger.info(f"Starting streaming process for {url}")
 
-        # Process streamed batches
-        for df_batch in stream_csv_from_url(url, batch_size, expected_columns, tracker):
-            batch_count += 1
-            batch_rows = len(df_batch)
+        if load_httpfs(conn):
+            total_rows = insert_csv_url_into_motherduck(
+                url, conn, schema_name, table_name, expected_columns
+            )
+            logger.success(f"Completed processing {table_name} with {total_rows} rows")
 
-            try:
-                insert_into_motherduck(df_batch, conn, schema_name, table_name)
+            if tracker:
+                tracker.add_info("total_batches", 1)
+                tracker.add_info("errors_count", 0)
 
-                total_rows += batch_rows
-                logger.info(
-                    f"Processed batch {batch_count} ({batch_rows} rows, {total_rows} total)"
-                )
+            return total_rows, file_size
 
-                if tracker and batch_count % 10 == 0:
-                    tracker.add_info("batches_processed", batch_count)
-                    tracker.add_info("current_total_rows", total_rows)
+        # Size batches from the table width rather than the configured constant
+        batch_size = tune_batch_size(
+            len(expected_columns) if expected_columns else DEFAULT_COLUMN_COUNT
+        )
+        logger.info(f"Streaming in batches of {batch_size:,} rows")
 
-            except Exception as e:
-                error_msg = f"Error processing batch {batch_count}: {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+        # Fall back to streaming batches through Python, inserting on a
+        # separate cursor so download and parse overlap with the inserts
+        batch_queue = queue.Queue(maxsize=INSERT_QUEUE_SIZE)
+        cursor = conn.cursor()
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                inserter = executor.submit(
+                    insert_batches_from_queue,
+                    batch_queue,
+                    cursor,
+                    schema_name,
+                    table_name,
+                    errors,
+                    tracker,
+                )
+                try:
+                    for df_batch in stream_csv_from_url(
+                        url, batch_size, expected_columns, tracker
+                    ):
+                        batch_queue.put(df_batch)
+                finally:
+                    batch_queue.put(None)
+
+                total_rows, batch_count = inserter.result()
+        finally:
+            cursor.close()
 
         if total_rows == 0:
             logger.warning(f"No data found in {url}")
@@ -329,9 +534,9 @@ def process_streaming_csv(
                 logger.error(f"... and {len(errors) - 5} more errors")
 
 
-def process_post_code_p002(
-    download_links: List[str],
-    table_names: List[str],
+def process_post_code_file(
+    csv_url: str,
+    table_name: str,
     batch_size: int,
     conn,
     schema_name: str,
@@ -339,49 +544,21 @@ def process_post_code_p002(
     config: Optional[DataSourceConfig] = None,
 ) -> None:
     """
-    Process Postcode P002 CSV files with metadata tracking.
+    Process a single Postcode P002 CSV file with metadata tracking.
 
     Args:
-        download_links: List of CSV URLs
-        table_names: List of table names
+        csv_url: URL of the CSV file
+        table_name: Table name
         batch_size: Batch size for processing
-        conn: Database connection
+        conn: Database connection or cursor owned by the calling thread
         schema_name: Schema name
         expected_columns: Dict of expected column names and types for validation
         config: Data source configuration (enables metadata logging if provided)
     """
-    if len(download_links) != len(table_names):
-        raise ValueError("Number of download links must match number of table names")
+    logger.info(f"Processing {table_name} from {csv_url}")
 
-    for csv_url, table_name in zip(download_links, table_names):
-        logger.info(f"Processing {table_name} from {csv_url}")
-
-        if config:
-            with metadata_tracker(config, conn, csv_url) as tracker:
-                try:
-                    total_rows, file_size = process_streaming_csv(
-                        url=csv_url,
-                        batch_size=batch_size,
-                        conn=conn,
-                        schema_name=schema_name,
-                        table_name=table_name,
-                        expected_columns=expected_columns,
-                        tracker=tracker,
-                    )
-
-                    tracker.set_rows_processed(total_rows)
-                    tracker.set_file_size(file_size)
-                    tracker.add_info("batch_size", batch_size)
-                    tracker.add_info("table_name", table_name)
-                    tracker.add_info("file_format", "csv")
-
-                    logger.success(f"Completed processing table: {table_name}")
-
-                except Exception as e:
-                    logger.error(f"Failed to process {table_name}: {e}")
-                    raise
-        else:
-            logger.warning("No config provided - metadata logging disabled")
+    if config:
+        with metadata_tracker(config, conn, csv_url) as tracker:
             try:
                 total_rows, file_size = process_streaming_csv(
                     url=csv_url,
@@ -390,10 +567,97 @@ def process_post_code_p002(
                     schema_name=schema_name,
                     table_name=table_name,
                     expected_columns=expected_columns,
+                    tracker=tracker,
                 )
 
+                tracker.set_rows_processed(total_rows)
+                tracker.set_file_size(file_size)
+                tracker.add_info("batch_size", batch_size)
+                tracker.add_info("table_name", table_name)
+                tracker.add_info("file_format", "csv")
+
                 logger.success(f"Completed processing table: {table_name}")
 
             except Exception as e:
                 logger.error(f"Failed to process {table_name}: {e}")
                 raise
+    else:
+        logger.warning("No config provided - metadata logging disabled")
+        try:
+            total_rows, file_size = process_streaming_csv(
+                url=csv_url,
+                batch_size=batch_size,
+                conn=conn,
+                schema_name=schema_name,
+                table_name=table_name,
+                expected_columns=expected_columns,
+            )
+
+            logger.success(f"Completed processing table: {table_name}")
+
+        except Exception as e:
+            logger.error(f"Failed to process {table_name}: {e}")
+            raise
+
+
+def process_post_code_p002(
+    download_links: List[str],
+    table_names: List[str],
+    batch_size: int,
+    conn,
+    schema_name: str,
+    expected_columns: Optional[Dict[str, str]] = None,
+    config: Optional[DataSourceConfig] = None,
+    max_workers: int = MAX_WORKERS,
+) -> None:
+    """
+    Process Postcode P002 CSV files with metadata tracking.
+
+    Each file goes to its own table, so files are loaded concurrently, each
+    on its own DuckDB cursor.
+
+    Args:
+        download_links: List of CSV URLs
+        table_names: List of table names
+        batch_size: Batch size for processing
+        conn: Database connection
+        schema_name: Schema name
+        expected_columns: Dict of expected column names and types for validation
+        config: Data source configuration (enables metadata logging if provided)
+        max_workers: Maximum number of files to process at once
+    """
+    if len(download_links) != len(table_names):
+        raise ValueError("Number of download links must match number of table names")
+
+    if not download_links:
+        return
+
+    def process_with_cursor(csv_url: str, table_name: str) -> None:
+        # DuckDB connections are not safe to share across threads, cursors are
+        cursor = conn.cursor()
+        try:
+            process_post_code_file(
+                csv_url,
+                table_name,
+                batch_size,
+                cursor,
+                schema_name,
+                expected_columns,
+                config,
+            )
+        finally:
+            cursor.close()
+
+    workers = max(1, min(max_workers, len(download_links)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(process_with_cursor, csv_url, table_name)
+            for csv_url, table_name in zip(download_links, table_names)
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
@@ -0,0 +1,431 @@
+import json
+import os
+import random
+import time
+import pyarrow as pa
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+
+from stream_unzip import stream_unzip
+from loguru import logger
+from tqdm import tqdm
+
+from .data_processor_utils import RETRYABLE_ERRORS, prefetch_batches
+
+# Bytes read from the HTTP response per chunk fed to stream_unzip
+DOWNLOAD_CHUNK_SIZE = 1048576
+
+# Threads decoding and flattening archive entries in parallel
+PARSE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Rows per DuckDB execution vector
+DUCKDB_VECTOR_SIZE = 2048
+
+# Parsed items are packed into Arrow every this many rows, so a large insert
+# batch is not held as Python dicts until it is flushed. A whole number of
+# vectors keeps each record batch from ending on a partial vector
+RECORD_BATCH_ROWS = 5 * DUCKDB_VECTOR_SIZE
+
+# Size of the pieces stream_unzip inflates each entry into. Most documents
+# then arrive as a single piece, which b"".join hands back without copying
+UNZIP_CHUNK_SIZE = 1048576
+
+# Insert retries back off exponentially from the base delay, up to the cap
+MAX_INSERT_RETRIES = 6
+RETRY_BASE_DELAY = 3
+RETRY_MAX_DELAY = 60
+
+# Arrow schemas already inferred for a feed, keyed by its flattened key order
+_schema_cache: dict[tuple[str, ...], pa.Schema] = {}
+
+
+def read_response_chunks(
+    response, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Read a streamed response body straight from the urllib3 stream, skipping
+    the extra copy and generator layer of requests' iter_content.
+
+    Args:
+        response: Streaming requests response
+        chunk_size: Bytes to read per chunk
+
+    Yields:
+        Chunks of the (content-decoded) body
+    """
+    response.raw.decode_content = True
+    while chunk := response.raw.read(chunk_size):
+        yield chunk
+
+
+@lru_cache(maxsize=8)
+def rename_columns(column_names: tuple[str, ...]) -> list[str]:
+    """
+    Replace 'object_data.' prefix in column names with empty string.
+
+    Cached on the column tuple, since every chunk of a feed has the same names.
+
+    Args:
+        column_names: Tuple of column names
+
+    Returns:
+        List of renamed column names
+    """
+    return [col.replace("object_data.", "") for col in column_names]
+
+
+def align_to_target(table: pa.Table, table_columns: list[str]) -> Optional[pa.Table]:
+    """
+    Reorder a batch into the target table's column order so it can be
+    appended positionally.
+
+    Names are matched case-insensitively, as DuckDB does, and target columns
+    the batch lacks are filled with NULL.
+
+    Args:
+        table: Batch to insert
+        table_columns: Column names of the target table, in order
+
+    Returns:
+        Aligned PyArrow Table, or None if the batch has columns the target lacks
+    """
+    if table.column_names == table_columns:
+        return table
+
+    by_name = {name.lower(): name for name in table.column_names}
+    if by_name.keys() - {name.lower() for name in table_columns}:
+        return None
+
+    columns = [
+        table.column(by_name[name.lower()])
+        if name.lower() in by_name
+        else pa.nulls(table.num_rows)
+        for name in table_columns
+    ]
+    return pa.Table.from_arrays(columns, names=table_columns)
+
+
+def insert_table_to_motherduck(
+    table: pa.Table,
+    conn,
+    schema: str,
+    table_name: str,
+    table_columns: Optional[list[str]] = None,
+) -> None:
+    """
+    Inserts a PyArrow table into a MotherDuck table with retry logic.
+
+    If the target's columns are given and cover the batch, the batch is
+    appended straight through a DuckDB relation. Otherwise it is registered
+    and copied over with a named INSERT ... SELECT.
+    """
+    aligned = align_to_target(table, table_columns) if table_columns else None
+
+    for attempt in range(MAX_INSERT_RETRIES):
+        try:
+            if aligned is not None:
+                conn.from_arrow(aligned).insert_into(f'"{schema}"."{table_name}"')
+                logger.success(f"Inserted {len(table)} rows into {schema}.{table_name}")
+                return
+
+            column_names = table.column_names
+            columns_sql = ", ".join([f'"{name}"' for name in column_names])
+
+            placeholders = ", ".join([f"input_data.{name}" for name in column_names])
+
+            insert_sql = f"""INSERT INTO "{schema}"."{table_name}" ({columns_sql})
+                            SELECT {placeholders} FROM input_data"""
+
+            # The view lives only on this cursor, so it is dropped (and the
+            # batch released) on close and cannot clash with other callers
+            with conn.cursor() as cursor:
+                cursor.register("input_data", table)
+                cursor.execute(insert_sql)
+
+            logger.success(f"Inserted {len(table)} rows into {schema}.{table_name}")
+            return
+
+        except Exception as e:
+            retryable = isinstance(e, RETRYABLE_ERRORS) or "lease expired" in str(e)
+            if retryable and attempt < MAX_INSERT_RETRIES - 1:
+                # Jitter stops concurrent writers from retrying in lockstep
+                wait_time = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+                wait_time *= random.uniform(0.5, 1.5)
+                logger.warning(f"Insert failed (attempt {attempt + 1}): {e}")
+                logger.info(f"Retrying in {wait_time:.1f} seconds...")
+                time.sleep(wait_time)
+            else:
+                logger.error(f"Error inserting PyArrow Table into DuckDB: {e}")
+                raise
+
+
+def flatten_json(json_data) -> dict:
+    """
+    Street manager archived open data comes in nested json files
+    This function flattens the structure
+
+    Args:
+        json_data to flatten
+
+    Returns:
+        flattened data
+    """
+    if type(json_data) is not dict:
+        return {"": json_data}
+
+    flattened_data = {}
+
+    # Walk the nesting with an explicit stack of (prefix, items) iterators,
+    # so each leaf key is built with a single concatenation. json.loads only
+    # produces plain dicts, so an exact type check is enough
+    stack = [("", iter(json_data.items()))]
+    push = stack.append
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            if type(value) is dict:
+                push((f"{prefix}{key}.", iter(value.items())))
+                break
+            flattened_data[prefix + key] = value
+        else:
+            stack.pop()
+
+    return flattened_data
+
+
+def process_json_chunk(chunk: bytes) -> dict[str, Any]:
+    """
+    Process a single JSON chunk by parsing it and flattening it.
+
+    Args:
+        chunk: Bytes containing JSON data
+
+    Returns:
+        Flattened JSON data as dictionary
+    """
+    json_data = json.loads(chunk)
+    return flatten_json(json_data)
+
+
+def drain_parsed_entries(
+    pending: deque[tuple[str, Future]], keep: int
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Yield finished entries from the front of the pending queue until at most
+    `keep` are left in flight.
+
+    Args:
+        pending: Queue of (file name, future) pairs in archive order
+        keep: Number of entries to leave in the queue
+
+    Yields:
+        Tuple of file name and flattened JSON data
+    """
+    while len(pending) > keep:
+        file_name, future = pending.popleft()
+        try:
+            item = future.result()
+        except Exception as e:
+            logger.error(f"Error processing file {file_name}: {e}")
+            raise
+        yield file_name, item
+
+
+def parse_entries(
+    zipped_chunks: Iterator, max_workers: int = PARSE_WORKERS
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Unzip the archive on a background thread and hand each JSON entry to a
+    worker pool for decoding and flattening. Inflating keeps going while the
+    caller inserts a batch, the number of entries in flight is bounded by
+    `max_workers`, and results come back in archive order.
+
+    Args:
+        zipped_chunks: Iterator of zipped bytes
+        max_workers: Number of parser threads
+
+    Yields:
+        Tuple of file name and flattened JSON data
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit_entries() -> Iterator[tuple[str, Future]]:
+        for file, size, unzipped_chunks in stream_unzip(
+            zipped_chunks, chunk_size=UNZIP_CHUNK_SIZE
+        ):
+            file_name = file.decode("utf-8") if isinstance(file, bytes) else file
+            bytes_obj = b"".join(unzipped_chunks)
+            yield file_name, executor.submit(process_json_chunk, bytes_obj)
+
+    pending = deque()
+    submitted = prefetch_batches(submit_entries(), max_pending=2 * max_workers)
+    try:
+        for entry in submitted:
+            pending.append(entry)
+            yield from drain_parsed_entries(pending, 2 * max_workers - 1)
+
+        yield from drain_parsed_entries(pending, 0)
+    finally:
+        submitted.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def chunks_to_arrow_table(flattened_data: list[dict[str, Any]]) -> pa.Table:
+    """
+    Convert a list of flattened dictionaries to a PyArrow table.
+
+    Columns follow the first item's keys, with missing keys as nulls. Once
+    a key layout has been seen with every column typed, its schema is reused
+    instead of being inferred again; if a chunk does not fit it, the chunk
+    falls back to inference.
+
+    Args:
+        flattened_data: List of dictionaries with flattened data
+
+    Returns:
+        PyArrow Table
+    """
+    keys = tuple(flattened_data[0])
+    schema = _schema_cache.get(keys)
+
+    table = None
+    if schema is not None:
+        try:
+            table = pa.Table.from_pylist(flattened_data, schema=schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.debug("Cached schema no longer fits, inferring types again")
+
+    if table is None:
+        table = pa.Table.from_pylist(flattened_data)
+        if not any(pa.types.is_null(field.type) for field in table.schema):
+            _schema_cache[keys] = table.schema
+
+    # Rename columns to remove 'object_data.' prefix
+    new_names = rename_columns(tuple(table.column_names))
+    table = table.rename_columns(new_names)
+
+    return table
+
+
+def combine_arrow_chunks(
+    arrow_chunks: list[pa.Table], remaining_rows: list[dict[str, Any]]
+) -> pa.Table:
+    """
+    Join the Arrow chunks of one insert batch, plus any rows not yet packed,
+    into a single table. Columns follow the batch's first chunk, and types
+    are promoted where chunks disagree (e.g. a column that was all null).
+
+    Args:
+        arrow_chunks: Tables already built from earlier rows of the batch
+        remaining_rows: Flattened rows not yet converted
+
+    Returns:
+        PyArrow Table made of the chunks' record batches
+    """
+    if remaining_rows:
+        arrow_chunks = arrow_chunks + [chunks_to_arrow_table(remaining_rows)]
+
+    if len(arrow_chunks) == 1:
+        return arrow_chunks[0]
+
+    combined = pa.concat_tables(arrow_chunks, promote_options="permissive")
+    return combined.select(arrow_chunks[0].column_names)
+
+
+def build_batches(
+    zipped_chunks: Iterator, batch_size: int
+) -> Iterator[tuple[int, pa.Table]]:
+    """
+    Gather parsed archive entries into insert-sized Arrow tables.
+
+    Args:
+        zipped_chunks: Iterator of zipped bytes
+        batch_size: Number of items per insert batch
+
+    Yields:
+        Tuple of item count and PyArrow Table for each batch
+    """
+    batch_count = 0
+    arrow_chunks = []
+
+    # Rows waiting to be packed into Arrow, written in place and reused
+    flattened_data = [None] * RECORD_BATCH_ROWS
+    pending_rows = 0
+
+    for current_file, current_item in parse_entries(zipped_chunks):
+        try:
+            flattened_data[pending_rows] = current_item
+            pending_rows += 1
+            batch_count += 1
+
+            if pending_rows == RECORD_BATCH_ROWS:
+                arrow_chunks.append(chunks_to_arrow_table(flattened_data))
+                pending_rows = 0
+
+            if batch_count >= batch_size:
+                table = combine_arrow_chunks(
+                    arrow_chunks, flattened_data[:pending_rows]
+                )
+
+        except Exception as e:
+            logger.error(f"Error processing file {current_file}: {e}")
+            logger.error(f"Number of items in current batch: {batch_count}")
+            logger.error("Last processed item:")
+            for k, v in current_item.items():
+                logger.error(f"{k}: {type(v)} = {v}")
+            raise
+
+        if batch_count >= batch_size:
+            yield batch_count, table
+            arrow_chunks = []
+            pending_rows = 0
+            batch_count = 0
+
+    if batch_count:
+        yield (
+            batch_count,
+            combine_arrow_chunks(arrow_chunks, flattened_data[:pending_rows]),
+        )
+
+
+def batch_processor(
+    zipped_chunks: Iterator,
+    batch_size: int,
+    conn,
+    schema_name: str,
+    table_name: str,
+    tracker=None,
+) -> int:
+    """
+    Process data in batches and insert into MotherDuck.
+    Returns total rows processed.
+
+    The next batch is unzipped, parsed and converted on a background thread
+    while the current one is being inserted.
+    """
+    total_rows_processed = 0
+
+    try:
+        table_columns = conn.table(f'"{schema_name}"."{table_name}"').columns
+
+        # One batch waits ready while another is inserted and a third is built
+        with tqdm(unit="items", unit_scale=True, desc="Inserting") as pbar:
+            for batch_count, table in prefetch_batches(
+                build_batches(zipped_chunks, batch_size), max_pending=1
+            ):
+                insert_table_to_motherduck(
+                    table, conn, schema_name, table_name, table_columns
+                )
+                logger.success(f"Processed batch of {batch_count} items")
+                total_rows_processed += batch_count
+                pbar.update(batch_count)
+
+        logger.success("Data processing complete - all batches have been processed")
+        return total_rows_processed
+
+    except Exception as e:
+        logger.error(f"Error during batch processing: {e}")
+        raise
@@ -1,17 +1,51 @@
+import codecs
+import duckdb
+import io
+import os
+import queue
+import threading
 import pandas as pd
+import pyarrow as pa
 import time
 import psycopg2
+import shutil
+import zipfile
 
 from loguru import logger
+from typing import Iterable, Iterator, Optional
 from ...data_sources.data_source_config import DataProcessorType
 
+# Errors worth retrying an insert for - anything else (bad types, missing
+# columns) will fail the same way again
+RETRYABLE_ERRORS = (
+    duckdb.IOException,
+    duckdb.ConnectionException,
+    duckdb.TransactionException,
+)
 
-def insert_into_motherduck(df: pd.DataFrame, conn, schema: str, table: str) -> bool:
+# Bytes copied per read when extracting an archive member
+EXTRACT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Batches a background reader may hold before waiting for the consumer
+PREFETCH_QUEUE_SIZE = 2
+
+# Marks the end of a prefetched stream
+_END_OF_STREAM = object()
+
+# Insert batches are sized to hold roughly this many cells, within the bounds
+BATCH_CELL_BUDGET = 2_000_000
+MIN_BATCH_SIZE = 50_000
+MAX_BATCH_SIZE = 500_000
+
+
+def insert_into_motherduck(
+    df: pd.DataFrame | pa.Table, conn, schema: str, table: str
+) -> bool:
     """
     Insert DataFrame into MotherDuck with retry logic.
 
     Args:
-        df: DataFrame to insert
+        df: DataFrame or Arrow Table to insert, in the table's column order
         conn: Database connection
         schema: Database schema name
         table: Table name
@@ -28,35 +62,291 @@ def insert_into_motherduck(df: pd.DataFrame, conn, schema: str, table: str) -> b
 
     for attempt in range(max_retries):
         try:
-            conn.register("temp_df", df)
-            insert_sql = f"""INSERT INTO "{schema}"."{table}" SELECT * FROM temp_df"""
-            conn.execute(insert_sql)
+            relation = (
+                conn.from_arrow(df) if isinstance(df, pa.Table) else conn.from_df(df)
+            )
+            relation.insert_into(f'"{schema}"."{table}"')
 
             if attempt > 0:
                 logger.success(f"Successfully inserted data on attempt {attempt + 1}")
 
             return True
 
-        except Exception as e:
-            conn.unregister("temp_df")
-
+        except RETRYABLE_ERRORS as e:
             if attempt < max_retries - 1:
-                wait_time = (2**attempt) * base_delay
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                if isinstance(e, duckdb.TransactionException):
+                    # Write conflicts clear as soon as the other commit lands
+                    logger.info("Retrying immediately after transaction conflict...")
+                    continue
+                wait_time = (2**attempt) * base_delay
                 logger.info(f"Retrying in {wait_time} seconds...")
                 time.sleep(wait_time)
             else:
                 logger.error(f"All {max_retries} attempts failed. Final error: {e}")
                 raise
-        finally:
-            try:
-                conn.unregister("temp_df")
-            except Exception:
-                pass
 
     return False
 
 
+def tune_batch_size(column_count: int) -> int:
+    """
+    Choose a batch size from the width of the table being loaded.
+
+    Narrow tables get larger batches to spread the per-insert overhead,
+    wide tables smaller ones to keep each batch's memory bounded.
+
+    Args:
+        column_count: Number of columns in each batch
+
+    Returns:
+        Number of rows per batch
+    """
+    return max(
+        MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, BATCH_CELL_BUDGET // max(1, column_count))
+    )
+
+
+def prefetch_batches(
+    batches: Iterable, max_pending: int = PREFETCH_QUEUE_SIZE
+) -> Iterator:
+    """
+    Pull batches from an iterable on a background thread.
+
+    Lets the download and parse work behind the iterable carry on while the
+    caller inserts the previous batch. At most max_pending batches are held
+    in memory; an exception raised by the producer is re-raised here.
+
+    Args:
+        batches: Iterable of batches, e.g. a streaming CSV generator
+        max_pending: Maximum number of batches waiting to be consumed
+
+    Yields:
+        The batches, in their original order
+    """
+    batch_queue = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+    failures = []
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                batch_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+        except Exception as e:
+            failures.append(e)
+        put(_END_OF_STREAM)
+
+    producer = threading.Thread(target=produce, name="batch-prefetch", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            batch = batch_queue.get()
+            if batch is _END_OF_STREAM:
+                break
+            yield batch
+
+        if failures:
+            raise failures[0]
+    finally:
+        # Unblock the producer if the caller stops early
+        stop.set()
+        producer.join()
+
+
+def extract_geopackage(
+    zip_path: str, dest_dir: str, preferred_name: Optional[str] = None
+) -> Optional[str]:
+    """
+    Extract only the GeoPackage member of a zip archive.
+
+    Skips decompressing the documentation and other members that
+    extractall would also write out.
+
+    Args:
+        zip_path: Path to the downloaded zip
+        dest_dir: Directory to write the GeoPackage to
+        preferred_name: Substring picking one GeoPackage when several exist
+
+    Returns:
+        Path to the extracted GeoPackage, or None if the archive has none
+    """
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        members = [
+            info
+            for info in zip_ref.infolist()
+            if not info.is_dir() and info.filename.lower().endswith(".gpkg")
+        ]
+        if not members:
+            return None
+
+        if preferred_name:
+            preferred = [
+                info
+                for info in members
+                if preferred_name in os.path.basename(info.filename).lower()
+            ]
+            members = preferred or members
+
+        member = members[0]
+        gpkg_file = os.path.join(dest_dir, os.path.basename(member.filename))
+        logger.info(f"Extracting {member.filename} ({member.file_size:,} bytes)")
+
+        with zip_ref.open(member) as source, open(gpkg_file, "wb") as target:
+            shutil.copyfileobj(source, target, EXTRACT_CHUNK_SIZE)
+
+    return gpkg_file
+
+
+def reencode_utf8(chunks: Iterable[bytes], errors: str = "ignore") -> Iterator[bytes]:
+    """
+    Decode byte chunks as UTF-8 and encode them again, applying `errors`.
+
+    An incremental decoder is used so multi-byte characters split across
+    chunk boundaries survive.
+
+    Args:
+        chunks: Iterable of raw byte chunks
+        errors: Codec error handler for invalid bytes
+
+    Yields:
+        Valid UTF-8 byte chunks
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors=errors)
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text.encode("utf-8")
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail.encode("utf-8")
+
+
+class ChunkStream(io.RawIOBase):
+    """
+    Read-only file object over an iterable of byte chunks.
+
+    Lets readers that expect a file, such as pyarrow.csv.open_csv, consume
+    streamed content (e.g. the members yielded by stream_unzip) directly.
+
+    Pass errors="ignore" to drop bytes that aren't valid UTF-8 on the way
+    through, since Arrow's CSV reader rejects them outright.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], errors: Optional[str] = None):
+        if errors is not None:
+            chunks = reencode_utf8(chunks, errors)
+        self._chunks = iter(chunks)
+        self._pending: Optional[memoryview] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def skip_invalid_row(row) -> str:
+    """
+    Skip rows whose column count does not match the header.
+
+    Args:
+        row: PyArrow description of the invalid row
+
+    Returns:
+        "skip" so the reader drops the row and carries on
+    """
+    logger.warning(
+        f"Row has {row.actual_columns} values but header has "
+        f"{row.expected_columns} columns"
+    )
+    return "skip"
+
+
+def load_httpfs(conn) -> bool:
+    """
+    Load DuckDB's httpfs extension so CSVs can be read straight from a URL.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        True if the extension is available, False otherwise
+    """
+    try:
+        conn.execute("LOAD httpfs;")
+        return True
+    except duckdb.Error:
+        # Only download the extension when it isn't installed yet
+        pass
+
+    try:
+        conn.execute("INSTALL httpfs;")
+        conn.execute("LOAD httpfs;")
+        return True
+    except duckdb.Error as e:
+        logger.warning(f"Could not load httpfs extension: {e}")
+        return False
+
+
+def quote_copy_column(series: pd.Series) -> pd.Series:
+    """
+    Render a column as CSV fields for PostgreSQL COPY.
+
+    Every value is quoted and missing values are left as a bare empty
+    field, which COPY's CSV format reads as NULL. A quoted field never
+    matches the NULL string, so empty strings (or a literal \\N) survive.
+
+    Args:
+        series: Column to render
+
+    Returns:
+        Series of CSV field strings
+    """
+    text = series.astype(str).str.replace('"', '""', regex=False)
+    return ('"' + text + '"').where(series.notna(), "")
+
+
+def dataframe_to_copy_csv(df: pd.DataFrame) -> io.StringIO:
+    """
+    Write a DataFrame as headerless CSV where only missing values load as NULL.
+
+    Args:
+        df: DataFrame to write
+
+    Returns:
+        StringIO positioned at the start of the CSV text
+    """
+    csv_buffer = io.StringIO()
+    if len(df) and len(df.columns):
+        fields = [quote_copy_column(df[col]) for col in df.columns]
+        lines = fields[0].str.cat(fields[1:], sep=",") if len(fields) > 1 else fields[0]
+        csv_buffer.write("\n".join(lines))
+        csv_buffer.write("\n")
+    csv_buffer.seek(0)
+    return csv_buffer
+
+
 def insert_table_to_postgresql(df, conn, schema, table):
     """
     Inserts a DataFrame into a PostgreSQL table.
@@ -72,14 +362,10 @@ def insert_table_to_postgresql(df, conn, schema, table):
         cursor = conn.cursor()
         cursor.execute(f'DELETE FROM "{schema}"."{table}"')
 
-        # Insert new data row by row
-        for _, row in df.iterrows():
-            columns = ", ".join([f'"{col}"' for col in df.columns])
-            placeholders = ", ".join(["%s"] * len(df.columns))
-            insert_sql = (
-                f'INSERT INTO "{schema}"."{table}" ({columns}) VALUES ({placeholders})'
-            )
-            cursor.execute(insert_sql, tuple(row.values))
+        # Stream the rows in with a single COPY
+        columns = ", ".join([f'"{col}"' for col in df.columns])
+        copy_sql = f'COPY "{schema}"."{table}" ({columns}) FROM STDIN WITH (FORMAT csv)'
+        cursor.copy_expert(copy_sql, dataframe_to_copy_csv(df))
 
         conn.commit()
         cursor.close()
@@ -1,13 +1,26 @@
+import atexit
 import pandas as pd
 import json
+import queue
+import threading
 import uuid
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 from loguru import logger
-from ...data_sources.data_source_config import DataSourceConfig
+from ...data_sources.data_source_config import DataSourceConfig, DataProcessorType
 from ...data_processors.utils.data_processor_utils import insert_table
 
+# MotherDuck metadata logs waiting for the background writer
+_log_queue: queue.Queue = queue.Queue()
+_writer_lock = threading.Lock()
+_writer = None
+
+# Long-lived connection that queued logs are written through. Logs handed
+# over on any other connection or cursor are written inline, since those
+# may be closed before the writer gets to them
+_log_connection = None
+
 
 class MetadataTracker:
     """
@@ -109,7 +122,93 @@ def metadata_tracker(config: DataSourceConfig, conn, url: str):
         raise
 
     finally:
+        _queue_metadata_log(log_data, config, conn)
+
+
+def _write_queued_logs():
+    """
+    Background loop writing queued metadata logs, each on its own cursor.
+    """
+    while True:
+        log_data, config, cursor = _log_queue.get()
+        try:
+            _insert_metadata_log(log_data, config, cursor)
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+            _log_queue.task_done()
+
+
+def _queue_metadata_log(log_data: dict, config: DataSourceConfig, conn):
+    """
+    Hand a MotherDuck metadata log to the background writer so the pipeline
+    does not wait on the round trip. Only logs on the registered log
+    connection are queued; PostgreSQL logs and logs on short-lived worker
+    cursors are written inline.
+    """
+    global _writer
+
+    if (
+        config.processor_type != DataProcessorType.MOTHERDUCK
+        or conn is None
+        or conn is not _log_connection
+    ):
+        _insert_metadata_log(log_data, config, conn)
+        return
+
+    try:
+        # A cursor of its own keeps the write off the pipeline's connection
+        cursor = conn.cursor()
+    except Exception:
         _insert_metadata_log(log_data, config, conn)
+        return
+
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(
+                target=_write_queued_logs, name="metadata-log-writer", daemon=True
+            )
+            _writer.start()
+            atexit.register(flush_metadata_logs)
+
+    _log_queue.put((log_data, config, cursor))
+
+
+def flush_metadata_logs():
+    """
+    Block until every queued metadata log has been written.
+
+    Call this before closing the connection the logs were queued against.
+    """
+    _log_queue.join()
+
+
+def set_log_connection(conn):
+    """
+    Register the connection whose metadata logs may be written in the
+    background. It must stay open until release_log_connection is called.
+
+    Args:
+        conn: Root database connection, e.g. MotherDuckManager.connection
+    """
+    global _log_connection
+    _log_connection = conn
+
+
+def release_log_connection(conn):
+    """
+    Write any logs still queued on the connection and stop queueing new ones.
+    Call this before closing it.
+
+    Args:
+        conn: Connection previously passed to set_log_connection
+    """
+    global _log_connection
+    flush_metadata_logs()
+    if _log_connection is conn:
+        _log_connection = None
 
 
 def _insert_metadata_log(log_data: dict, config: DataSourceConfig, conn):
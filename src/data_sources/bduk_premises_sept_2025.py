@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Optional
 from .data_source_config import (
     DataProcessorType,
@@ -5,10 +6,23 @@ from .data_source_config import (
     TimeRange,
     DataSourceConfig,
 )
-import requests
-from bs4 import BeautifulSoup, Tag
+from .http_session import HTTP_SESSION, REQUEST_TIMEOUT
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
 
+# Prefer the C-backed lxml parser for the attachment pages, falling back to
+# the standard library parser where lxml is not installed
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only the attachment sections are needed, so the rest of the page is never
+# built into a tree
+ATTACHMENT_SECTIONS = SoupStrainer("section", class_="gem-c-attachment")
+
 
 class BDUKPremises(DataSourceConfig):
     """
@@ -54,16 +68,18 @@ class BDUKPremises(DataSourceConfig):
         """Get the base URL for the configured data source."""
         return self.source_type.base_url
 
-    @property
+    @cached_property
     def download_links(self):
         """
         Get the download links for BDUK premises data for each region.
         Returns a list of urls.
         """
         try:
-            response = requests.get(self.base_url)
+            response = HTTP_SESSION.get(self.base_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(
+                response.content, HTML_PARSER, parse_only=ATTACHMENT_SECTIONS
+            )
             region_links = {}
             # Find sections that are attachments (filter for .zip)
             for section in soup.find_all("section", class_="gem-c-attachment"):
@@ -103,7 +119,7 @@ class BDUKPremises(DataSourceConfig):
         """Get the schema name for the configured data source."""
         return "bduk_premises"
 
-    @property
+    @cached_property
     def table_names(self) -> list[str]:
         """Get the table names for the configured data source."""
         # Extract YYYYMM from base_url (e.g., "may-2025" -> "202505")
@@ -1,4 +1,4 @@
-import requests
+from functools import cached_property
 from typing import Optional, List
 from .data_source_config import (
     DataProcessorType,
@@ -6,6 +6,7 @@ from .data_source_config import (
     TimeRange,
     DataSourceConfig,
 )
+from .http_session import HTTP_SESSION, REQUEST_TIMEOUT
 
 
 class BuiltUpAreas(DataSourceConfig):
@@ -50,9 +51,11 @@ class BuiltUpAreas(DataSourceConfig):
         """Get the base URL for the configured data source."""
         return self.source_type.base_url
 
-    @property
+    @cached_property
     def download_links(self) -> list[str]:
-        response = requests.head(self.base_url, allow_redirects=True)
+        response = HTTP_SESSION.head(
+            self.base_url, allow_redirects=True, timeout=REQUEST_TIMEOUT
+        )
         return [response.url]
 
     @property
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Optional
 from .data_source_config import (
     DataProcessorType,
@@ -51,7 +52,7 @@ class CadentUndergroundPipes(DataSourceConfig):
         """Get the base URL for the configured data source."""
         return self.source_type.base_url
 
-    @property
+    @cached_property
     def download_links(self):
         """
         Get the download links for Cadent underground pipes data.
@@ -0,0 +1,31 @@
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout in seconds for scraping download pages
+REQUEST_TIMEOUT = (5, 30)
+
+
+def create_session() -> requests.Session:
+    """
+    Build a requests Session that keeps connections alive between calls and
+    retries transient failures with a short backoff.
+
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by the data source configs, so repeated lookups against the same
+# host reuse one connection pool
+HTTP_SESSION = create_session()
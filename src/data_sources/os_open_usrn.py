@@ -73,7 +73,8 @@ class OsOpenUsrn(DataSourceConfig):
     @property
     def db_template(self) -> dict:
         return {
-            "geometry": "VARCHAR",
+            # WKB, read with ST_GeomFromWKB
+            "geometry": "BLOB",
             "street_type": "VARCHAR",
             "usrn": "BIGINT",
         }
@@ -3,6 +3,10 @@ from loguru import logger
 from typing import Dict, Optional
 from ..data_sources.data_source_config import DataSourceConfig, DataProcessorType
 from ..databases.database_config import DatabaseProtocolTrait
+from ..data_processors.utils.metadata_logger import (
+    release_log_connection,
+    set_log_connection,
+)
 
 
 class MotherDuckManager(DatabaseProtocolTrait):
@@ -36,6 +40,7 @@ class MotherDuckManager(DatabaseProtocolTrait):
         try:
             connection_string = f"md:{self.database}?motherduck_token={self.token}"
             self.connection = duckdb.connect(connection_string)
+            set_log_connection(self.connection)
             logger.success("MotherDuck Connection Made")
             return self.connection
         except (duckdb.ConnectionException, duckdb.Error) as e:
@@ -202,6 +207,8 @@ class MotherDuckManager(DatabaseProtocolTrait):
     def close(self):
         """Close the MotherDuck connection."""
         if self.connection:
+            # Queued metadata logs write through cursors of this connection
+            release_log_connection(self.connection)
             self.connection.close()
             self.connection = None
             logger.info("MotherDuck Connection Closed")
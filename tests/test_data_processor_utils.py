@@ -0,0 +1,74 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pytest
+
+from src.data_processors.utils.data_processor_utils import (
+    ChunkStream,
+    dataframe_to_copy_csv,
+    skip_invalid_row,
+)
+
+
+def read_csv(chunks, **kwargs):
+    """Read chunks the way the processors do, with every column as a string."""
+    reader = pacsv.open_csv(
+        io.BufferedReader(ChunkStream(chunks, **kwargs)),
+        parse_options=pacsv.ParseOptions(invalid_row_handler=skip_invalid_row),
+        convert_options=pacsv.ConvertOptions(
+            column_types={"name": pa.string(), "count": pa.string()}
+        ),
+    )
+    return reader.read_all().to_pylist()
+
+
+def test_chunk_stream_reads_across_chunks():
+    """Rows split over several chunks are read back intact."""
+    chunks = [b"name,count\nab", b"c,1\nde", b"f,2\n"]
+
+    assert read_csv(chunks) == [
+        {"name": "abc", "count": "1"},
+        {"name": "def", "count": "2"},
+    ]
+
+
+def test_chunk_stream_rejects_invalid_utf8_by_default():
+    """Without an error handler Arrow refuses the bad byte."""
+    with pytest.raises(pa.ArrowInvalid):
+        read_csv([b"name,count\ncaf\xe9,1\n"])
+
+
+def test_chunk_stream_drops_invalid_utf8():
+    """A stray non-UTF-8 byte is dropped instead of failing the whole file."""
+    chunks = [b"name,count\ncaf\xe9,1\n", b"ok,2\n"]
+
+    assert read_csv(chunks, errors="ignore") == [
+        {"name": "caf", "count": "1"},
+        {"name": "ok", "count": "2"},
+    ]
+
+
+def test_chunk_stream_keeps_characters_split_between_chunks():
+    """Multi-byte characters cut at a chunk boundary are reassembled."""
+    encoded = "name\ncafé\n".encode("utf-8")
+    split = encoded.index(b"\xc3") + 1
+    chunks = [encoded[:split], encoded[split:]]
+
+    assert read_csv(chunks, errors="ignore") == [{"name": "café"}]
+
+
+def test_copy_csv_only_leaves_missing_values_unquoted():
+    """Missing values are bare empty fields; real strings, even \\N, are quoted."""
+    df = pd.DataFrame(
+        {
+            "name": ["a", "", None, "\\N", 'say "hi", ok'],
+            "value": [1.5, np.nan, 2.0, 3.0, 4.0],
+        }
+    )
+
+    assert dataframe_to_copy_csv(df).read() == (
+        '"a","1.5"\n"",\n,"2.0"\n"\\N","3.0"\n"say ""hi"", ok","4.0"\n'
+    )
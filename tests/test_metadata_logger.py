@@ -0,0 +1,60 @@
+import pytest
+import duckdb
+
+from src.data_sources.code_point import CodePoint
+from src.data_processors.utils.metadata_logger import (
+    flush_metadata_logs,
+    metadata_tracker,
+    release_log_connection,
+    set_log_connection,
+)
+
+
+@pytest.fixture
+def config():
+    return CodePoint.create_default_latest()
+
+
+@pytest.fixture
+def local_duckdb_connection(config):
+    """In-memory DuckDB connection with the metadata log table created."""
+    conn = duckdb.connect(database=":memory:", read_only=False)
+    columns = ", ".join(
+        f'"{name}" {col_type}' for name, col_type in config.metadata_db_template.items()
+    )
+    conn.execute(f'CREATE SCHEMA "{config.metadata_schema_name}"')
+    conn.execute(
+        f'CREATE TABLE "{config.metadata_schema_name}"."{config.metadata_table_name}" ({columns})'
+    )
+    set_log_connection(conn)
+    yield conn
+    release_log_connection(conn)
+    conn.close()
+
+
+def logged_rows(conn, config):
+    return conn.execute(
+        f'SELECT status, rows_processed FROM "{config.metadata_schema_name}"."{config.metadata_table_name}"'
+    ).fetchall()
+
+
+def test_log_on_root_connection_is_written(local_duckdb_connection, config):
+    """Logs queued on the registered connection land once flushed."""
+    with metadata_tracker(config, local_duckdb_connection, "https://example.com") as t:
+        t.set_rows_processed(10)
+
+    flush_metadata_logs()
+
+    assert logged_rows(local_duckdb_connection, config) == [("SUCCESS", 10)]
+
+
+def test_log_survives_worker_cursor_closing(local_duckdb_connection, config):
+    """A worker cursor closed straight after its file must not lose the log."""
+    cursor = local_duckdb_connection.cursor()
+    with metadata_tracker(config, cursor, "https://example.com") as t:
+        t.set_rows_processed(5)
+    cursor.close()
+
+    flush_metadata_logs()
+
+    assert logged_rows(local_duckdb_connection, config) == [("SUCCESS", 5)]
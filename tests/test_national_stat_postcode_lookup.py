@@ -0,0 +1,43 @@
+import duckdb
+import pytest
+
+from src.data_processors.national_stat_postcode_lookup import (
+    insert_csv_file_into_motherduck,
+)
+
+EXPECTED_COLUMNS = {
+    "pcds": "VARCHAR",
+    "oseast1m": "BIGINT",
+    "lat": "DOUBLE",
+    "lad25cd": "VARCHAR",
+}
+
+
+@pytest.fixture
+def conn():
+    conn = duckdb.connect(database=":memory:")
+    columns = ", ".join(f'"{col}" {dtype}' for col, dtype in EXPECTED_COLUMNS.items())
+    conn.execute('CREATE SCHEMA "s"')
+    conn.execute(f'CREATE TABLE "s"."nspl" ({columns})')
+    yield conn
+    conn.close()
+
+
+def test_ragged_rows_do_not_fail_the_file(tmp_path, conn):
+    """Short rows are padded, rows with extra values are skipped and counted."""
+    csv_file = tmp_path / "NSPL_TEST.csv"
+    csv_file.write_text(
+        "pcds,oseast1m,lat,lad25cd\n"
+        "AB1 2CD,394251,57.1,S12000033\n"
+        "EF3 4GH,401000\n"
+        "JK5 6LM,402000,52.5,E06000001,extra\n"
+    )
+
+    inserted, skipped = insert_csv_file_into_motherduck(
+        str(csv_file), conn, "s", "nspl", EXPECTED_COLUMNS
+    )
+
+    assert (inserted, skipped) == (2, 1)
+    assert conn.execute(
+        'SELECT pcds, oseast1m, lat FROM "s"."nspl" ORDER BY pcds'
+    ).fetchall() == [("AB1 2CD", 394251, 57.1), ("EF3 4GH", 401000, None)]
@@ -0,0 +1,88 @@
+import csv
+
+import duckdb
+import pandas as pd
+import pytest
+
+from src.data_processors.ons_uprn_directory import (
+    clean_dataframe_for_motherduck,
+    insert_csv_file_into_motherduck,
+    insert_into_motherduck,
+)
+
+EXPECTED_COLUMNS = {
+    "uprn": "BIGINT",
+    "pcds": "VARCHAR",
+    "lat": "DOUBLE",
+    "lad25cd": "VARCHAR",
+}
+
+FIXTURE_ROWS = [
+    "uprn,pcds,lat,lad25cd",
+    "1,AB1 2CD,51.5,E06000001",
+    "2,,nan,",
+    "3,nan,not-a-number,null",
+    '4,"EF3, 4GH",NaN,""',
+    ",XY9 9ZZ,52.25,E06000002",
+]
+
+
+@pytest.fixture
+def conn():
+    conn = duckdb.connect(database=":memory:")
+    columns = ", ".join(f'"{col}" {dtype}' for col, dtype in EXPECTED_COLUMNS.items())
+    conn.execute('CREATE SCHEMA "s"')
+    conn.execute(f'CREATE TABLE "s"."native" ({columns})')
+    conn.execute(f'CREATE TABLE "s"."pandas" ({columns})')
+    yield conn
+    conn.close()
+
+
+def write_csv(tmp_path, rows):
+    path = tmp_path / "ONSUD_TEST.csv"
+    path.write_text("\n".join(rows) + "\n")
+    return str(path)
+
+
+def load_with_dict_reader(csv_file, conn, table):
+    """The row-by-row path used for every processor type but MotherDuck."""
+    with open(csv_file, newline="") as file:
+        reader = csv.DictReader(file, fieldnames=list(EXPECTED_COLUMNS))
+        next(reader)
+        df = pd.DataFrame(list(reader))
+    df = clean_dataframe_for_motherduck(df, EXPECTED_COLUMNS)
+    insert_into_motherduck(df, conn, "s", table)
+
+
+def table_rows(conn, table):
+    return conn.execute(
+        f'SELECT * FROM "s"."{table}" ORDER BY uprn NULLS LAST, pcds'
+    ).fetchall()
+
+
+def test_native_load_matches_dict_reader(tmp_path, conn):
+    """DuckDB's reader gives the same rows as DictReader plus pandas cleaning."""
+    csv_file = write_csv(tmp_path, FIXTURE_ROWS)
+
+    inserted, skipped = insert_csv_file_into_motherduck(
+        csv_file, conn, "s", "native", EXPECTED_COLUMNS
+    )
+    load_with_dict_reader(csv_file, conn, "pandas")
+
+    assert (inserted, skipped) == (5, 0)
+    assert table_rows(conn, "native") == table_rows(conn, "pandas")
+
+
+def test_ragged_rows_do_not_fail_the_file(tmp_path, conn):
+    """Short rows are padded, rows with extra values are skipped and counted."""
+    rows = FIXTURE_ROWS[:2] + ["5,JK1 1LM", "6,NP2 2QR,53.0,E06000003,extra"]
+    csv_file = write_csv(tmp_path, rows)
+
+    inserted, skipped = insert_csv_file_into_motherduck(
+        csv_file, conn, "s", "native", EXPECTED_COLUMNS
+    )
+
+    assert (inserted, skipped) == (2, 1)
+    assert conn.execute(
+        'SELECT uprn, pcds, lat FROM "s"."native" ORDER BY uprn'
+    ).fetchall() == [(1, "AB1 2CD", 51.5), (5, "JK1 1LM", None)]
@@ -0,0 +1,72 @@
+import duckdb
+import pytest
+
+from src.data_processors import post_code_p001, post_code_p002
+
+FIXTURES = [
+    (
+        post_code_p001,
+        {
+            "Postcode": "VARCHAR",
+            "Sex_Code": "BIGINT",
+            "Sex_Label": "VARCHAR",
+            "Count": "BIGINT",
+        },
+        "Postcode,Sex_Code,Sex_Label,Count\n"
+        "AB1 2CD,1,Female,10\n"
+        ",2,,\n"
+        "nan, 1 ,null,NaN\n"
+        '"EF3, 4GH",,"",x\n',
+    ),
+    (
+        post_code_p002,
+        {"Postcode": "VARCHAR", "Count": "BIGINT"},
+        'Postcode,Count\nAB1 2CD,10\n,\nnan, 7 \n"",null\n',
+    ),
+]
+
+
+class FakeResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.headers = {"content-length": str(len(body))}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+
+@pytest.mark.parametrize("module, expected_columns, body", FIXTURES)
+def test_native_and_streaming_paths_store_the_same_rows(
+    tmp_path, monkeypatch, module, expected_columns, body
+):
+    """read_csv and the Arrow/Polars fallback clean the CSV identically."""
+    csv_file = tmp_path / "postcodes.csv"
+    csv_file.write_text(body)
+    monkeypatch.setattr(
+        module.requests, "get", lambda *a, **k: FakeResponse(body.encode())
+    )
+
+    conn = duckdb.connect(database=":memory:")
+    columns = ", ".join(f'"{col}" {dtype}' for col, dtype in expected_columns.items())
+    conn.execute('CREATE SCHEMA "s"')
+    conn.execute(f'CREATE TABLE "s"."native" ({columns})')
+    conn.execute(f'CREATE TABLE "s"."streamed" ({columns})')
+
+    module.insert_csv_url_into_motherduck(
+        str(csv_file), conn, "s", "native", expected_columns
+    )
+    for df_batch in module.stream_csv_from_url(str(csv_file), 2, expected_columns):
+        module.insert_into_motherduck(df_batch, conn, "s", "streamed")
+
+    def rows(table):
+        return conn.execute(
+            f'SELECT * FROM "s"."{table}" ORDER BY ALL NULLS FIRST'
+        ).fetchall()
+
+    assert rows("native") == rows("streamed")
+    assert len(rows("native")) == 4
+    conn.close()